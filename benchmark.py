@@ -0,0 +1,458 @@
+import argparse
+import http.server
+import json
+import platform
+import random
+import statistics
+import subprocess
+import threading
+import time as timer
+import tracemalloc
+from collections import Counter
+
+from bs4.builder import builder_registry
+
+from run import LinkValidator
+
+
+def generate_page(num_anchors, seed=0):
+    """
+    Generate a synthetic webpage with num_anchors links of every kind.
+    """
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><title>Benchmark</title>",
+        "<script>var fake = '<a href=\"/not-a-link\">';</script>",
+        "</head><body>",
+    ]
+    for i in range(num_anchors):
+        kind = rng.randrange(8)
+        aria = f' aria-label="Link {i}"' if rng.random() < 0.5 else ""
+        if kind == 0:
+            anchor = f'<a href="/page/{i}"{aria}>Page {i}</a>'
+        elif kind == 1:
+            anchor = f'<a href="https://host{i % 20}.example.org/{i}"{aria}>'
+            anchor += "External</a>"
+        elif kind == 2:
+            anchor = f'<A HREF="docs/{i}?a=1&amp;b=2#top"{aria}>Docs</A>'
+        elif kind == 3:
+            anchor = f'<a href="mailto:user{i}@example.com"{aria}>Mail</a>'
+        elif kind == 4:
+            anchor = f'<a href="#section-{i}"{aria}>Section</a>'
+        elif kind == 5:
+            anchor = f"<a{aria}>No href</a>"
+        elif kind == 6:
+            anchor = f"<a href='/quoted/{i}' aria-label=''>Quoted</a>"
+        else:
+            anchor = f'<a href="/dup/{i}" href="/second/{i}">Dup</a>'
+        parts.append(
+            f"<div class='card'><p>Paragraph {i} with <b>markup</b>"
+            f" and text.</p>{anchor}</div>\n"
+        )
+    parts.append("<!-- <a href='/commented-out'>x</a> --></body></html>")
+    return "".join(parts)
+
+
+def benchmark_parsers(num_anchors, repeat, parsers):
+    """
+    Time every parser on the same page and check they find the same
+    anchors as the html.parser backend.
+    Returns a list with the results of every parser.
+    """
+    link_validator = LinkValidator(interactive=False)
+    content = generate_page(num_anchors).encode("utf-8")
+    base_url = "https://example.com/"
+    reference = None
+    results = []
+
+    for parser in parsers:
+        # Skip BeautifulSoup parsers that are not installed (e.g. lxml)
+        if parser != "stream" and builder_registry.lookup(parser) is None:
+            print(f"{parser:<12} not installed, skipped")
+            continue
+
+        link_validator.PARSER = parser
+        timings = []
+        for _ in range(repeat):
+            start = timer.perf_counter()
+            anchors = link_validator.parse_anchors(content, base_url)
+            timings.append(timer.perf_counter() - start)
+
+        # The line numbers depend on the parser, everything else must match
+        found = [anchor[:5] for anchor in anchors]
+        if reference is None:
+            reference = found
+        results.append(
+            {
+                "parser": parser,
+                "anchors": len(anchors),
+                "best_seconds": min(timings),
+                "mean_seconds": statistics.mean(timings),
+                "same_output": found == reference,
+            }
+        )
+
+    baseline = results[0]["best_seconds"] if results else None
+    print(
+        f"\n{'Parser':<12} {'Anchors':>8} {'Best (s)':>10} {'Mean (s)':>10}"
+        f" {'Speedup':>8}  Same output"
+    )
+    for result in results:
+        result["speedup"] = baseline / result["best_seconds"]
+        print(
+            f"{result['parser']:<12} {result['anchors']:>8}"
+            f" {result['best_seconds']:>10.4f}"
+            f" {result['mean_seconds']:>10.4f}"
+            f" {result['speedup']:>7.2f}x  {result['same_output']}"
+        )
+    return results
+
+
+class FarmHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Request handler of one host of the mock HTTP farm. The behaviour of
+    the host is set on its server:
+    - "ok": answers 200 after the latency,
+    - "status": answers the status code at the end of the path,
+    - "redirect": redirects every path to the "ok" host,
+    - "nohead": rejects HEAD requests with 405,
+    - "hang": doesn't answer until the hang time has passed.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send(self, status_code, body=b"", headers=None):
+        self.send_response(status_code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        timer.sleep(server.latency)
+        if self.path == "/page":
+            self.send(
+                200,
+                server.page,
+                {"Content-Type": "text/html; charset=utf-8"},
+            )
+        elif self.path == "/robots.txt":
+            self.send(404)
+        elif server.behaviour == "status":
+            self.send(int(self.path.rsplit("/", 1)[1]))
+        elif server.behaviour == "redirect":
+            self.send(301, headers={"Location": server.redirect_to})
+        elif server.behaviour == "nohead" and self.command == "HEAD":
+            self.send(405)
+        elif server.behaviour == "hang":
+            timer.sleep(server.hang)
+            self.send(200)
+        else:
+            self.send(200, b"ok")
+
+    do_HEAD = do_GET
+
+
+class FarmServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def start_farm(latency, hang):
+    """
+    Start one local server per host behaviour.
+    Returns a dictionary mapping each behaviour to its server.
+    """
+    farm = {}
+    for behaviour in ["ok", "status", "redirect", "nohead", "hang"]:
+        server = FarmServer(("127.0.0.1", 0), FarmHandler)
+        server.behaviour = behaviour
+        server.latency = latency
+        server.hang = hang
+        server.page = b""
+        server.url = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        farm[behaviour] = server
+    farm["redirect"].redirect_to = farm["ok"].url + "/target"
+    return farm
+
+
+def stop_farm(farm):
+    """
+    Stop every server of the mock HTTP farm.
+    """
+    for server in farm.values():
+        server.shutdown()
+        server.server_close()
+
+
+def generate_farm_page(farm, num_anchors, num_hanging, seed=0):
+    """
+    Generate a webpage with num_anchors unique links spread over the
+    hosts of the farm, num_hanging of them to the hanging host.
+    """
+    rng = random.Random(seed)
+    statuses = [404, 410, 500, 503]
+    parts = ["<!DOCTYPE html><html><body>"]
+    for i in range(num_anchors):
+        if i < num_hanging:
+            url = f"{farm['hang'].url}/{i}"
+        else:
+            kind = rng.choices(
+                ["ok", "status", "redirect", "nohead"], [70, 10, 10, 10]
+            )[0]
+            if kind == "status":
+                url = f"{farm['status'].url}/{i}/{rng.choice(statuses)}"
+            else:
+                url = f"{farm[kind].url}/{i}"
+        aria = f' aria-label="Link {i}"' if rng.random() < 0.5 else ""
+        parts.append(f'<p><a href="{url}"{aria}>Link {i}</a></p>\n')
+    parts.append("</body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def get_percentile(values, percentile):
+    """
+    Get a percentile of a list of values (e.g. 95 for p95).
+    """
+    if len(values) < 2:
+        return values[0] if values else None
+    return statistics.quantiles(values, n=100, method="inclusive")[
+        percentile - 1
+    ]
+
+
+def get_commit():
+    """
+    Get the git commit being benchmarked, or None outside a repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scan(link_validator, page_url, track_memory=False):
+    """
+    Scan the farm page once, the way scrape_and_validate_links does,
+    timing every check_link_status call.
+    Returns the rows, seconds, per-link latencies and peak memory.
+    """
+    latencies = []
+    check_link_status = LinkValidator.check_link_status
+
+    def timed_check_link_status(*args):
+        start = timer.perf_counter()
+        try:
+            return check_link_status(link_validator, *args)
+        finally:
+            latencies.append(timer.perf_counter() - start)
+
+    link_validator.check_link_status = timed_check_link_status
+    if track_memory:
+        tracemalloc.start()
+    start = timer.perf_counter()
+    try:
+        rows = list(link_validator.iter_scan_results(page_url))
+        seconds = timer.perf_counter() - start
+        peak_memory = None
+        if track_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+        del link_validator.check_link_status
+    return rows, seconds, latencies, peak_memory
+
+
+def benchmark_scan(
+    num_anchors,
+    repeat,
+    latency,
+    num_hanging,
+    read_timeout,
+    host_rate=0,
+):
+    """
+    Time whole scans of a page linking to a local mock HTTP farm.
+    Every run starts with empty caches. With host_rate 0 the per-host
+    rate limit is lifted so the scan path itself is measured (the
+    per-host concurrency cap still applies). Peak memory is measured in
+    an extra run, as tracing allocations slows the scan down.
+    Returns the results as a dictionary.
+    """
+    farm = start_farm(latency, hang=read_timeout * 10)
+    farm["ok"].page = generate_farm_page(farm, num_anchors, num_hanging)
+    page_url = farm["ok"].url + "/page"
+
+    def create_link_validator():
+        link_validator = LinkValidator(interactive=False)
+        link_validator.USE_CACHE = False
+        link_validator.READ_TIMEOUT = read_timeout
+        # A bucket this large never runs out during a benchmark
+        rate = host_rate or 10**9
+        link_validator.HOST_SCHEDULER.rate = rate
+        link_validator.HOST_SCHEDULER.burst = rate
+        return link_validator
+
+    runs = []
+    try:
+        for _ in range(repeat):
+            rows, seconds, latencies, _ = run_scan(
+                create_link_validator(), page_url
+            )
+            runs.append((seconds, latencies, rows))
+            print(
+                f"{len(rows)} links in {seconds:.2f} s"
+                f" ({len(rows) / seconds:.1f} links/s)"
+            )
+        peak_memory = run_scan(
+            create_link_validator(), page_url, track_memory=True
+        )[3]
+    finally:
+        stop_farm(farm)
+
+    seconds, latencies, rows = min(runs, key=lambda run: run[0])
+    result = {
+        "benchmark": "scan",
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "timestamp": timer.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "anchors": num_anchors,
+        "hanging_links": num_hanging,
+        "latency_seconds": latency,
+        "read_timeout_seconds": read_timeout,
+        "host_rate": host_rate,
+        "runs": repeat,
+        "links": len(rows),
+        "statuses": dict(Counter(row[3] for row in rows)),
+        "best_seconds": seconds,
+        "mean_seconds": statistics.mean(run[0] for run in runs),
+        "links_per_second": len(rows) / seconds,
+        "latency_p50_seconds": get_percentile(latencies, 50),
+        "latency_p95_seconds": get_percentile(latencies, 95),
+        "latency_p99_seconds": get_percentile(latencies, 99),
+        "peak_memory_bytes": peak_memory,
+    }
+
+    print(f"\n{'Links':<24} {result['links']}")
+    print(f"{'Statuses':<24} {result['statuses']}")
+    print(f"{'Best time (s)':<24} {result['best_seconds']:.3f}")
+    print(f"{'Links per second':<24} {result['links_per_second']:.1f}")
+    for percentile in [50, 95, 99]:
+        value = result[f"latency_p{percentile}_seconds"]
+        print(f"{f'p{percentile} latency (ms)':<24} {value * 1000:.1f}")
+    print(f"{'Peak memory (MiB)':<24} {peak_memory / 2**20:.1f}")
+    return result
+
+
+def parse_arguments():
+    """
+    Parse the command-line arguments of the benchmarks.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the Link-Validator Tool."
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    parsers_parser = subparsers.add_parser(
+        "parsers", help="compare the HTML parser backends"
+    )
+    parsers_parser.add_argument(
+        "--anchors",
+        type=int,
+        default=5000,
+        help="number of anchors in the page",
+    )
+    parsers_parser.add_argument(
+        "--repeat", type=int, default=5, help="number of runs per parser"
+    )
+    parsers_parser.add_argument(
+        "--parsers",
+        nargs="+",
+        default=["html.parser", "lxml", "stream"],
+        help="parsers to compare (the first one is the baseline)",
+    )
+    parsers_parser.add_argument(
+        "--json", help="file to write the results to as JSON"
+    )
+
+    scan_parser = subparsers.add_parser(
+        "scan", help="time whole scans against a local mock HTTP farm"
+    )
+    scan_parser.add_argument(
+        "--anchors",
+        type=int,
+        default=500,
+        help="number of links in the page",
+    )
+    scan_parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed scans"
+    )
+    scan_parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="seconds every farm host takes to answer",
+    )
+    scan_parser.add_argument(
+        "--hanging",
+        type=int,
+        default=2,
+        help="number of links to a host that never answers in time",
+    )
+    scan_parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=1,
+        help="read timeout of the link checks in seconds",
+    )
+    scan_parser.add_argument(
+        "--host-rate",
+        type=float,
+        default=0,
+        help="requests per second per host (default 0: no rate limit)",
+    )
+    scan_parser.add_argument(
+        "--json", help="file to write the results to as JSON"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    if arguments.benchmark == "parsers":
+        print(
+            f"Parsing a page with {arguments.anchors} anchors"
+            f" ({arguments.repeat} runs per parser)..."
+        )
+        results = benchmark_parsers(
+            arguments.anchors, arguments.repeat, arguments.parsers
+        )
+    elif arguments.benchmark == "scan":
+        print(
+            f"Scanning a page with {arguments.anchors} links to a local"
+            f" HTTP farm ({arguments.repeat} runs)..."
+        )
+        results = benchmark_scan(
+            arguments.anchors,
+            arguments.repeat,
+            arguments.latency,
+            arguments.hanging,
+            arguments.read_timeout,
+            arguments.host_rate,
+        )
+    if arguments.json:
+        with open(arguments.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
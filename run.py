@@ -1,18 +1,1559 @@
+import argparse
+import bisect
+import csv
+import json
+import multiprocessing
 import os
+import random
+import re
 import shutil
+import socket
+import sqlite3
+import sys
+import threading
 import time as timer
 import urllib.parse
+import urllib.robotparser
 import webbrowser
+from array import array
+from collections import Counter, OrderedDict, deque, namedtuple
+from contextlib import closing, contextmanager, nullcontext
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
+from itertools import chain
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from urllib.parse import urljoin
 
 import colorama
 import gspread
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.dammit import UnicodeDammit
 from colorama import Back, Fore, Style
 from google.oauth2.service_account import Credentials
 from tqdm import tqdm
+from urllib3.util import connection as urllib3_connection
+
+# One anchor of a webpage: its absolute URL, the raw href, whether it has
+# an aria label, whether it is internal and where it is in the page
+Anchor = namedtuple(
+    "Anchor", ["url", "href", "has_aria", "internal", "position", "line"]
+)
+
+# Shared no-op context used when the scan metrics are disabled
+NULL_CONTEXT = nullcontext()
+
+# How urllib3 opens its connections, resolving the host name every time
+CREATE_CONNECTION = urllib3_connection.create_connection
+
+
+class AnchorExtractor(HTMLParser):
+    """
+    Streaming HTML tokenizer that only collects the href, aria-label and
+    line of every <a> tag, without building a document tree.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a":
+            return
+        # Later duplicates win and valueless attributes are empty, as in
+        # BeautifulSoup
+        attributes = {name: value or "" for name, value in attrs}
+        self.anchors.append(
+            (
+                attributes.get("href"),
+                attributes.get("aria-label"),
+                self.getpos()[0],
+            )
+        )
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+
+def parse_anchors(content, base_url, parser):
+    """
+    Parse the HTML of a webpage with a parser and extract its anchors.
+    "stream" only collects the anchor attributes without building a
+    tree; other values are BeautifulSoup parsers.
+    Raises FeatureNotFound if the BeautifulSoup parser isn't installed.
+    """
+    if parser == "stream":
+        # Decode the page the same way BeautifulSoup would
+        markup = UnicodeDammit(content, is_html=True).unicode_markup or ""
+        extractor = AnchorExtractor()
+        extractor.feed(markup)
+        extractor.close()
+        return build_anchors(extractor.anchors, base_url)
+    return extract_anchors(BeautifulSoup(content, parser), base_url)
+
+
+def extract_anchors(soup, base_url):
+    """
+    Extract every anchor of a parsed webpage in a single pass.
+    Returns a list of Anchor records in document order.
+    """
+    return build_anchors(
+        (
+            (tag.get("href"), tag.get("aria-label"), tag.sourceline)
+            for tag in soup.find_all("a")
+        ),
+        base_url,
+    )
+
+
+def build_anchors(raw_anchors, base_url):
+    """
+    Build Anchor records from (href, aria label, line) tuples.
+    """
+    # Parse the base URL only once for the whole page
+    base_netloc = urllib.parse.urlparse(base_url).netloc
+    anchors = []
+    for position, (href, aria_label, line) in enumerate(raw_anchors):
+        try:
+            # Join base URL with relative URL to get full URL
+            url = urljoin(base_url, href)
+            internal = urllib.parse.urlparse(url).netloc == base_netloc
+        except ValueError:
+            # Malformed href (e.g. "http://[::1"), kept as it is and
+            # reported as an invalid link
+            url = href
+            internal = False
+        anchors.append(
+            Anchor(
+                url=url,
+                href=href,
+                has_aria=bool(aria_label),
+                internal=internal,
+                position=position,
+                line=line,
+            )
+        )
+    return anchors
+
+
+class LinkStatusCache:
+    """
+    Persistent cache of link statuses, stored as a JSON file and keyed
+    by canonical URL.
+    """
+
+    def __init__(self, path, ttl, max_entries):
+        self.path = path
+        # Seconds an entry stays fresh, per status class ("2xx", "error"...)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """
+        Load the cache file, starting empty if it is missing or corrupt.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.entries = OrderedDict(json.load(file))
+        except (OSError, ValueError):
+            self.entries = OrderedDict()
+
+    def save(self):
+        """
+        Write the cache to disk, least recently used entries first.
+        """
+        with self.lock:
+            entries = dict(self.entries)
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            # Replace the old file in one step so it is never half written
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def get(self, url, allow_stale=False):
+        """
+        Get the cached entry for a URL, or None if it is missing or stale.
+        Stale entries are returned with allow_stale, e.g. to revalidate
+        them with a conditional request.
+        """
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+            # Mark the entry as recently used
+            self.entries.move_to_end(url)
+            ttl = self.ttl.get(entry["status_class"], 0)
+            if not allow_stale and timer.time() - entry["checked_at"] >= ttl:
+                return None
+            return entry
+
+    def set(
+        self,
+        url,
+        status,
+        response,
+        status_class,
+        etag=None,
+        last_modified=None,
+        anchors=None,
+        redirects=None,
+        final_url=None,
+        final_response=None,
+        reason="http",
+    ):
+        """
+        Store the status of a URL, evicting the least recently used
+        entries when the cache is full.
+        reason is the code of what decided the status ("http" for an HTTP
+        answer, "timeout", "redirect-loop"...).
+        Links that redirect also store their number of redirects, final
+        URL and the response of the final URL.
+        Returns the new entry.
+        """
+        entry = {
+            "status": status,
+            "response": response,
+            "reason": reason,
+            "status_class": status_class,
+            "checked_at": timer.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        if anchors is not None:
+            entry["anchors"] = anchors
+        if redirects is not None:
+            entry["redirects"] = redirects
+            entry["final_url"] = final_url
+            entry["final_response"] = final_response
+        with self.lock:
+            self.entries[url] = entry
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def get_status_class(self, status_code):
+        """
+        Get the status class of an HTTP status code (e.g. 404 -> "4xx").
+        """
+        return f"{status_code // 100}xx"
+
+
+class HostScheduler:
+    """
+    Politeness scheduler in front of the link checks: caps the requests
+    in flight to every host and spaces them out with a token bucket per
+    host, so no single origin is overloaded while other hosts are still
+    checked at full speed.
+    """
+
+    def __init__(self, max_concurrency, rate, burst, get_crawl_delay=None):
+        # Requests in flight to one host at the same time
+        self.max_concurrency = max_concurrency
+        # Requests per second and burst size of every host's token bucket
+        self.rate = rate
+        self.burst = burst
+        # Called once per host to read its robots.txt crawl-delay
+        self.get_crawl_delay = get_crawl_delay
+        self.hosts = {}
+        self.lock = threading.Lock()
+        # Host whose token the current thread was handed (see prepaid)
+        self.local = threading.local()
+
+    def get_host(self, url):
+        """
+        Get the scheduling state of the host of a URL, creating it the
+        first time the host is seen.
+        """
+        parsed_url = urllib.parse.urlsplit(url)
+        host = f"{parsed_url.scheme.lower()}://{parsed_url.netloc.lower()}"
+        with self.lock:
+            state = self.hosts.get(host)
+            if state is None:
+                state = {
+                    "semaphore": threading.BoundedSemaphore(
+                        self.max_concurrency
+                    ),
+                    "lock": threading.Lock(),
+                    "rate": self.rate,
+                    "burst": self.burst,
+                    "tokens": self.burst,
+                    "updated": timer.monotonic(),
+                    "blocked_until": 0,
+                    "crawl_delay": None,
+                    "configured": False,
+                    # Tokens taken for checks that haven't finished
+                    "prepaid": 0,
+                }
+                self.hosts[host] = state
+        return host, state
+
+    def configure(self, host, state):
+        """
+        Slow the token bucket of a host down to its robots.txt
+        crawl-delay. The crawl-delay is only read once per host.
+        """
+        with state["lock"]:
+            if state["configured"]:
+                return
+            state["configured"] = True
+            if self.get_crawl_delay is None:
+                return
+            crawl_delay = self.get_crawl_delay(host)
+            if crawl_delay:
+                state["crawl_delay"] = crawl_delay
+                state["rate"] = min(state["rate"], 1 / crawl_delay)
+                state["burst"] = 1
+                state["tokens"] = min(state["tokens"], 1)
+
+    def take_token(self, state):
+        """
+        Take a token from the bucket of a host if the host isn't blocked.
+        Returns 0 once the token is taken, or the seconds to wait for one.
+        """
+        with state["lock"]:
+            now = timer.monotonic()
+            elapsed = now - state["updated"]
+            state["tokens"] = min(
+                state["burst"], state["tokens"] + elapsed * state["rate"]
+            )
+            state["updated"] = now
+            delay = state["blocked_until"] - now
+            if delay <= 0:
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return 0
+                delay = (1 - state["tokens"]) / state["rate"]
+            return delay
+
+    def wait_for_token(self, host, state, deadline=None):
+        """
+        Wait until the host is no longer blocked and its bucket has a
+        token, then take it.
+        Raises a Timeout if the token comes after the deadline.
+        """
+        while True:
+            delay = self.take_token(state)
+            if not delay:
+                return
+            if deadline is not None and timer.monotonic() + delay > deadline:
+                raise requests.exceptions.Timeout(
+                    f"Rate limit of {host} leaves no time for the request"
+                )
+            timer.sleep(delay)
+
+    def try_take_token(self, url):
+        """
+        Take a token for a request to the host of a URL without waiting.
+        Until the crawl-delay of the host has been read, only a token for
+        the first request is handed out.
+        Returns 0 once the token is taken, or the seconds to wait for one
+        (None when it depends on the requests in flight).
+        """
+        host, state = self.get_host(url)
+        if not state["configured"] and state["prepaid"]:
+            return None
+        delay = self.take_token(state)
+        if not delay:
+            with state["lock"]:
+                state["prepaid"] += 1
+        return delay
+
+    @contextmanager
+    def prepaid(self, url):
+        """
+        Let the first request of the current thread to the host of a URL
+        use the token taken by try_take_token instead of waiting for one.
+        The token is given back if no request used it.
+        """
+        host, state = self.get_host(url)
+        self.local.prepaid = host
+        try:
+            yield
+        finally:
+            if self.local.prepaid is not None:
+                self.local.prepaid = None
+                with state["lock"]:
+                    state["tokens"] = min(state["burst"], state["tokens"] + 1)
+            with state["lock"]:
+                state["prepaid"] -= 1
+
+    @contextmanager
+    def slot(self, url, deadline=None):
+        """
+        Hold one of the concurrent slots of the host of a URL for the
+        duration of a request, once its rate limit allows it.
+        Raises a Timeout if the request would have to wait past the
+        deadline.
+        """
+        host, state = self.get_host(url)
+        self.configure(host, state)
+        timeout = -1
+        if deadline is not None:
+            timeout = max(deadline - timer.monotonic(), 0)
+        if not state["semaphore"].acquire(timeout=timeout):
+            raise requests.exceptions.Timeout(
+                f"No free connection to {host} in time for the request"
+            )
+        try:
+            if getattr(self.local, "prepaid", None) == host:
+                self.local.prepaid = None
+            else:
+                self.wait_for_token(host, state, deadline)
+            yield
+        finally:
+            state["semaphore"].release()
+
+    def defer(self, url, delay):
+        """
+        Stop sending requests to the host of a URL for delay seconds
+        (e.g. after a 429 response with a Retry-After header).
+        """
+        host, state = self.get_host(url)
+        with state["lock"]:
+            state["blocked_until"] = max(
+                state["blocked_until"], timer.monotonic() + delay
+            )
+
+    def get_crawl_delays(self):
+        """
+        Get the robots.txt crawl-delay of every host that has one.
+        """
+        with self.lock:
+            hosts = list(self.hosts.items())
+        return {
+            host: state["crawl_delay"]
+            for host, state in hosts
+            if state["crawl_delay"]
+        }
+
+
+class HostQueues:
+    """
+    Queue of the link checks of a scan in front of the check threads,
+    with one queue per host. A check is only handed to the threads once
+    its host has a free connection and a rate limit token, so threads
+    don't sit waiting for a throttled host while the links to other hosts
+    are ready.
+    """
+
+    def __init__(self, executor, scheduler, check):
+        self.executor = executor
+        self.scheduler = scheduler
+        # Called with the URL and the arguments of every queued check
+        self.check = check
+        self.queues = OrderedDict()
+        self.in_flight = Counter()
+        # Host and key of every check handed to the threads
+        self.futures = {}
+
+    def put(self, key, url, *args):
+        """
+        Queue the check of a URL, identified by key once it is done.
+        """
+        host = self.scheduler.get_host(url)[0]
+        self.queues.setdefault(host, deque()).append((key, url, args))
+
+    def pop(self, future):
+        """
+        Forget a finished check, freeing a connection of its host.
+        Returns the key of the check.
+        """
+        host, key = self.futures.pop(future)
+        self.in_flight[host] -= 1
+        if not self.in_flight[host]:
+            del self.in_flight[host]
+        return key
+
+    def run_check(self, url, args):
+        """
+        Run a check on a thread with the token taken for it.
+        """
+        with self.scheduler.prepaid(url):
+            return self.check(url, *args)
+
+    def submit_ready(self):
+        """
+        Hand the checks whose host is ready to the threads.
+        Returns the seconds until a queued check gets its token, or None
+        if the queued checks wait for the checks in flight.
+        """
+        next_delay = None
+        for host in list(self.queues):
+            queue = self.queues[host]
+            while (
+                queue
+                and self.in_flight[host] < self.scheduler.max_concurrency
+            ):
+                key, url, args = queue[0]
+                delay = self.scheduler.try_take_token(url)
+                if delay is None:
+                    break
+                if delay:
+                    if next_delay is None or delay < next_delay:
+                        next_delay = delay
+                    break
+                queue.popleft()
+                future = self.executor.submit(self.run_check, url, args)
+                self.futures[future] = (host, key)
+                self.in_flight[host] += 1
+            if not queue:
+                del self.queues[host]
+        return next_delay
+
+    def wait(self, futures=()):
+        """
+        Hand the ready checks to the threads and wait until one of them
+        or of the other futures is done, or until a queued check gets its
+        token.
+        Returns the futures that are done.
+        """
+        timeout = self.submit_ready()
+        done, _ = wait(
+            list(futures) + list(self.futures),
+            timeout=timeout,
+            return_when=FIRST_COMPLETED,
+        )
+        return done
+
+    def is_empty(self):
+        """
+        Check whether every queued check is done.
+        """
+        return not self.queues and not self.futures
+
+
+class RedirectCache:
+    """
+    Redirects seen during the scans, mapping the exact URL of each hop
+    (without its fragment) to the absolute URL it redirects to. A hop
+    shared by many links (e.g. http -> https or an added trailing slash)
+    is only requested once. Entries expire after ttl seconds, so a
+    redirect changed on the server is noticed in a long session.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        # Lock and number of threads waiting for every URL being requested
+        self.url_locks = {}
+
+    @contextmanager
+    def lock_url(self, url):
+        """
+        Let one thread at a time request a URL, so the threads following
+        the same redirect wait for the first one instead of requesting it
+        again.
+        """
+        with self.lock:
+            url_lock = self.url_locks.setdefault(url, [threading.Lock(), 0])
+            url_lock[1] += 1
+        try:
+            with url_lock[0]:
+                yield
+        finally:
+            with self.lock:
+                url_lock[1] -= 1
+                if not url_lock[1]:
+                    del self.url_locks[url]
+
+    def get(self, url):
+        """
+        Get the URL a URL redirects to, or None if it isn't known or has
+        expired.
+        """
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+            location, stored_at = entry
+            if timer.monotonic() - stored_at >= self.ttl:
+                del self.entries[url]
+                return None
+            self.entries.move_to_end(url)
+            return location
+
+    def set(self, url, location):
+        """
+        Store a redirect, forgetting the least recently used ones when
+        the cache is full.
+        """
+        with self.lock:
+            self.entries[url] = (location, timer.monotonic())
+            self.entries.move_to_end(url)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+class ScanHistory:
+    """
+    Results of the last scan of every start URL and crawl depth, stored
+    as a JSON file so the next scan can be compared against them.
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.load()
+
+    def load(self):
+        """
+        Load the history file, starting empty if it is missing or corrupt.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.entries = OrderedDict(json.load(file))
+        except (OSError, ValueError):
+            self.entries = OrderedDict()
+
+    def save(self):
+        """
+        Write the history to disk, oldest scans first.
+        """
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def get_key(self, start_url, max_depth):
+        """
+        Get the key of the scans of a start URL with a crawl depth, so a
+        crawl and a single page scan of the same URL are kept apart.
+        """
+        return f"{max_depth} {start_url}"
+
+    def get(self, start_url, max_depth):
+        """
+        Get the results of the last scan of a start URL with a crawl
+        depth, or None if it was never scanned with that depth.
+        Returns a dictionary mapping each link to (type, status, response,
+        missing aria, reason).
+        """
+        entry = self.entries.get(self.get_key(start_url, max_depth))
+        if entry is None:
+            return None
+        return entry["results"]
+
+    def set(self, start_url, max_depth, results):
+        """
+        Store the results of a scan, forgetting the oldest scans when the
+        history is full.
+        """
+        key = self.get_key(start_url, max_depth)
+        self.entries[key] = {
+            "depth": max_depth,
+            "scanned_at": timer.time(),
+            "results": results,
+        }
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+
+class HostUnreachable(requests.exceptions.RequestException):
+    """
+    Raised instead of sending a request to a host that is known to be
+    down or whose name cannot be resolved.
+    """
+
+
+class HostHealth:
+    """
+    Health of every host shared across a scan: a DNS resolution cache,
+    used by every new connection, and a circuit breaker that stops
+    sending requests to a host after a number of consecutive connection
+    failures. Once the host has been left alone for a while, a single
+    probe request decides whether it is back.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout, dns_ttl, metrics):
+        # Consecutive connection failures that trip the breaker
+        self.failure_threshold = failure_threshold
+        # Seconds before a probe is sent to a host that tripped the breaker
+        self.reset_timeout = reset_timeout
+        # Seconds a DNS resolution (or failure) is cached
+        self.dns_ttl = dns_ttl
+        self.metrics = metrics
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def get_host(self, url):
+        """
+        Get the state of the host of a URL, creating it the first time
+        the host is seen.
+        Raises InvalidURL if the port of the URL is invalid.
+        """
+        parsed_url = urllib.parse.urlsplit(url)
+        host = (parsed_url.hostname or "").lower()
+        try:
+            port = parsed_url.port
+        except ValueError as e:
+            # Reported like any other invalid link instead of stopping
+            # the scan
+            raise requests.exceptions.InvalidURL(f"{e}: {url}") from e
+        port = port or (443 if parsed_url.scheme == "https" else 80)
+        with self.lock:
+            # Services on other ports of the same host can be up or down
+            state = self.hosts.get((host, port))
+            if state is None:
+                state = {
+                    "lock": threading.Lock(),
+                    "circuit": "closed",
+                    "failures": 0,
+                    "opened_at": 0,
+                    "addresses": None,
+                    "resolved_at": None,
+                }
+                self.hosts[(host, port)] = state
+        return host, port, state
+
+    def resolve(self, host, port, state):
+        """
+        Resolve a host name once per dns_ttl.
+        Returns its addresses, or None if the name cannot be resolved.
+        """
+        now = timer.monotonic()
+        resolved_at = state["resolved_at"]
+        if resolved_at is not None and now - resolved_at < self.dns_ttl:
+            self.metrics.count_cache("dns", "hit")
+            return state["addresses"]
+        self.metrics.count_cache("dns", "miss")
+        try:
+            addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            addresses = None
+        state["addresses"] = addresses
+        state["resolved_at"] = now
+        return addresses
+
+    def before_request(self, url):
+        """
+        Check that a request may be sent to the host of a URL.
+        Raises HostUnreachable if the host name cannot be resolved or the
+        breaker of the host is open. When the breaker has been open for
+        reset_timeout seconds, one request is let through as a probe.
+        """
+        host, port, state = self.get_host(url)
+        if not host:
+            return
+        with state["lock"]:
+            if state["circuit"] == "closed":
+                if self.resolve(host, port, state) is None:
+                    # An unknown name won't resolve on the next link either
+                    state["circuit"] = "open"
+                    state["opened_at"] = timer.monotonic()
+                    raise HostUnreachable(
+                        f"Host unreachable: {host} could not be resolved"
+                    )
+                return
+            waited = timer.monotonic() - state["opened_at"]
+            if state["circuit"] == "open" and waited >= self.reset_timeout:
+                # This request is the probe, the others keep failing fast
+                state["circuit"] = "half-open"
+                state["resolved_at"] = None
+                if self.resolve(host, port, state) is not None:
+                    return
+                state["circuit"] = "open"
+                state["opened_at"] = timer.monotonic()
+            if not state["failures"]:
+                raise HostUnreachable(
+                    f"Host unreachable: {host} could not be resolved"
+                )
+            raise HostUnreachable(
+                f"Host unreachable: {host} failed {state['failures']}"
+                + " times in a row, not checked"
+            )
+
+    @contextmanager
+    def request(self, url):
+        """
+        Send a request to the host of a URL inside the block and record
+        whether the host answered it.
+        Raises HostUnreachable before the request if the host is down
+        (see before_request).
+        """
+        self.before_request(url)
+        try:
+            yield
+        except requests.exceptions.ConnectionError:
+            self.record_failure(url)
+            raise
+        except BaseException:
+            # A probe without an answer (e.g. a read timeout) mustn't
+            # leave the breaker half-open
+            self.release_probe(url)
+            raise
+        self.record_success(url)
+
+    def release_probe(self, url):
+        """
+        Open the breaker of a host again when its probe request neither
+        succeeded nor failed to connect, so another probe is sent once
+        reset_timeout seconds have passed.
+        """
+        _, _, state = self.get_host(url)
+        with state["lock"]:
+            if state["circuit"] == "half-open":
+                state["circuit"] = "open"
+                state["opened_at"] = timer.monotonic()
+
+    def create_connection(self, address, *args, **kwargs):
+        """
+        Open a connection of urllib3 to the addresses cached for its host,
+        so new connections don't resolve the host name again. Hosts
+        without fresh cached addresses are resolved by urllib3.
+        """
+        host, port = address
+        with self.lock:
+            state = self.hosts.get((host.strip("[]").lower(), port))
+        addresses = None
+        if state is not None:
+            with state["lock"]:
+                resolved_at = state["resolved_at"]
+                if (
+                    resolved_at is not None
+                    and timer.monotonic() - resolved_at < self.dns_ttl
+                ):
+                    addresses = state["addresses"]
+        if not addresses:
+            return CREATE_CONNECTION(address, *args, **kwargs)
+        error = None
+        for _, _, _, _, socket_address in addresses:
+            try:
+                return CREATE_CONNECTION(
+                    (socket_address[0], port), *args, **kwargs
+                )
+            except OSError as e:
+                error = e
+        raise error
+
+    def install(self):
+        """
+        Make urllib3 open its connections through create_connection.
+        """
+        urllib3_connection.create_connection = self.create_connection
+
+    def record_success(self, url):
+        """
+        Close the breaker of a host after it answered a request.
+        """
+        _, _, state = self.get_host(url)
+        with state["lock"]:
+            state["circuit"] = "closed"
+            state["failures"] = 0
+
+    def record_failure(self, url):
+        """
+        Count a connection failure of a host, tripping its breaker after
+        failure_threshold failures in a row or when the probe failed.
+        """
+        _, _, state = self.get_host(url)
+        with state["lock"]:
+            state["failures"] += 1
+            if (
+                state["circuit"] == "half-open"
+                or state["failures"] >= self.failure_threshold
+            ):
+                state["circuit"] = "open"
+                state["opened_at"] = timer.monotonic()
+
+    def get_unreachable_hosts(self):
+        """
+        Get the hosts whose breaker is currently open.
+        """
+        with self.lock:
+            hosts = list(self.hosts.items())
+        return [
+            f"{host}:{port}"
+            for (host, port), state in hosts
+            if state["circuit"] != "closed"
+        ]
+
+
+class ScanMetrics:
+    """
+    Timers and counters of the hot paths of a scan: time per phase,
+    requests, bytes and latency histograms per host, and cache hits.
+    When disabled every method returns straight away, so the
+    instrumentation costs next to nothing.
+    """
+
+    def __init__(self, enabled, latency_buckets):
+        self.enabled = enabled
+        # Upper bounds (in seconds) of the latency histogram buckets
+        self.latency_buckets = latency_buckets
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the metrics of the previous scan.
+        """
+        with self.lock:
+            self.started_at = timer.time()
+            self.phases = {}  # Calls and seconds of every phase
+            self.hosts = {}  # Requests, bytes and latencies of every host
+            self.cache_events = Counter()  # (cache, result) counts
+
+    def phase(self, name):
+        """
+        Time a phase of the scan, e.g. with metrics.phase("parse"): ...
+        Phases that run in several threads add up the time of each one.
+        """
+        if not self.enabled:
+            return NULL_CONTEXT
+        return self.timed_phase(name)
+
+    @contextmanager
+    def timed_phase(self, name):
+        start = timer.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, timer.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """
+        Add the time of one call of a phase.
+        """
+        if not self.enabled:
+            return
+        with self.lock:
+            phase = self.phases.setdefault(name, [0, 0.0])
+            phase[0] += 1
+            phase[1] += seconds
+
+    def count_cache(self, cache, result):
+        """
+        Count a cache lookup, e.g. ("link", "hit") or ("page", "miss").
+        """
+        if not self.enabled:
+            return
+        with self.lock:
+            self.cache_events[(cache, result)] += 1
+
+    def record_response(self, response, *args, **kwargs):
+        """
+        Record the latency of a response. Used as a response hook of the
+        requests session, so every request is counted.
+        The body isn't read yet when the hook runs, its size is added
+        with add_bytes by whoever reads it.
+        """
+        if not self.enabled:
+            return
+        host = urllib.parse.urlsplit(response.request.url).netloc
+        latency = response.elapsed.total_seconds()
+        bucket = bisect.bisect_left(self.latency_buckets, latency)
+        with self.lock:
+            stats = self.get_host_stats(host)
+            stats["requests"] += 1
+            stats["latency_seconds"] += latency
+            stats["buckets"][bucket] += 1
+
+    def add_bytes(self, url, num_bytes):
+        """
+        Count the bytes of a response body that was downloaded. Checks
+        that close the response unread download nothing.
+        """
+        if not self.enabled:
+            return
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            self.get_host_stats(host)["bytes"] += num_bytes
+
+    def get_host_stats(self, host):
+        """
+        Get the counters of a host, creating them the first time the
+        host is seen. Must be called with the lock held.
+        """
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = {
+                "requests": 0,
+                "bytes": 0,
+                "latency_seconds": 0.0,
+                "buckets": [0] * (len(self.latency_buckets) + 1),
+            }
+            self.hosts[host] = stats
+        return stats
+
+    def get_latency_percentile(self, stats, percentile):
+        """
+        Estimate a latency percentile of a host from its histogram.
+        Returns the upper bound of the bucket it falls in (None for the
+        last, unbounded bucket).
+        """
+        target = stats["requests"] * percentile / 100
+        total = 0
+        for bound, count in zip(self.latency_buckets, stats["buckets"]):
+            total += count
+            if total >= target:
+                return bound
+        return None
+
+    def get_cache_stats(self):
+        """
+        Get the hits, revalidations (304), misses and hit rate of every
+        cache.
+        """
+        caches = {}
+        for (cache, result), count in self.cache_events.items():
+            caches.setdefault(cache, {"hit": 0, "miss": 0, "revalidated": 0})
+            caches[cache][result] = count
+        for stats in caches.values():
+            # Revalidated entries were reused without downloading them
+            reused = stats["hit"] + stats["revalidated"]
+            lookups = reused + stats["miss"]
+            stats["hit_rate"] = reused / lookups if lookups else None
+        return caches
+
+    def to_dict(self):
+        """
+        Get all the metrics as a dictionary that can be saved as JSON.
+        """
+        with self.lock:
+            phases = {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in self.phases.items()
+            }
+            hosts = {}
+            for host, stats in self.hosts.items():
+                bounds = [str(bound) for bound in self.latency_buckets]
+                hosts[host] = {
+                    "requests": stats["requests"],
+                    "bytes": stats["bytes"],
+                    "latency_seconds": stats["latency_seconds"],
+                    "latency_histogram": dict(
+                        zip(bounds + ["+Inf"], stats["buckets"])
+                    ),
+                }
+            caches = self.get_cache_stats()
+        return {
+            "started_at": self.started_at,
+            "phases": phases,
+            "hosts": hosts,
+            "caches": caches,
+        }
+
+    def to_prometheus(self):
+        """
+        Get all the metrics in the Prometheus text exposition format.
+        """
+        metrics = self.to_dict()
+        lines = [
+            "# HELP link_validator_phase_seconds_total Time spent in each"
+            " phase of the scan.",
+            "# TYPE link_validator_phase_seconds_total counter",
+        ]
+        for name, phase in metrics["phases"].items():
+            lines.append(
+                f'link_validator_phase_seconds_total{{phase="{name}"}}'
+                f" {phase['seconds']}"
+            )
+        lines += [
+            "# HELP link_validator_phase_calls_total Calls of each phase of"
+            " the scan.",
+            "# TYPE link_validator_phase_calls_total counter",
+        ]
+        for name, phase in metrics["phases"].items():
+            lines.append(
+                f'link_validator_phase_calls_total{{phase="{name}"}}'
+                f" {phase['calls']}"
+            )
+        lines += [
+            "# HELP link_validator_response_bytes_total Bytes of the"
+            " responses received from each host.",
+            "# TYPE link_validator_response_bytes_total counter",
+        ]
+        for host, stats in metrics["hosts"].items():
+            lines.append(
+                f'link_validator_response_bytes_total{{host="{host}"}}'
+                f" {stats['bytes']}"
+            )
+        lines += [
+            "# HELP link_validator_request_duration_seconds Latency of the"
+            " requests sent to each host.",
+            "# TYPE link_validator_request_duration_seconds histogram",
+        ]
+        for host, stats in metrics["hosts"].items():
+            total = 0
+            for bound, count in stats["latency_histogram"].items():
+                total += count
+                lines.append(
+                    "link_validator_request_duration_seconds_bucket"
+                    f'{{host="{host}",le="{bound}"}} {total}'
+                )
+            lines.append(
+                "link_validator_request_duration_seconds_sum"
+                f'{{host="{host}"}} {stats["latency_seconds"]}'
+            )
+            lines.append(
+                "link_validator_request_duration_seconds_count"
+                f'{{host="{host}"}} {stats["requests"]}'
+            )
+        lines += [
+            "# HELP link_validator_cache_lookups_total Lookups of each"
+            " cache by result.",
+            "# TYPE link_validator_cache_lookups_total counter",
+        ]
+        for cache, stats in metrics["caches"].items():
+            for result in ["hit", "miss", "revalidated"]:
+                lines.append(
+                    "link_validator_cache_lookups_total"
+                    f'{{cache="{cache}",result="{result}"}} {stats[result]}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def save(self, path, output_format="json"):
+        """
+        Write the metrics to a file as JSON or Prometheus text.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            if output_format == "prometheus":
+                file.write(self.to_prometheus())
+            else:
+                json.dump(self.to_dict(), file, indent=2)
+
+
+class ResultSink:
+    """
+    Base class for the places where the scan results are saved.
+    The first row written after clear() is the header row.
+    """
+
+    name = "Results"
+
+    def clear(self):
+        """
+        Remove all saved rows (including the header).
+        """
+        raise NotImplementedError
+
+    def append_rows(self, rows):
+        """
+        Append rows after the rows already saved.
+        """
+        raise NotImplementedError
+
+    def read_rows(self):
+        """
+        Read all saved rows, header first.
+        """
+        raise NotImplementedError
+
+    def get_revision(self):
+        """
+        Get a value that changes whenever the saved rows change.
+        Returns None if the revision is unknown.
+        """
+        return None
+
+    def get_location(self):
+        """
+        Get the URL or path of the saved results.
+        """
+        raise NotImplementedError
+
+
+class FileSink(ResultSink):
+    """
+    Base class for results saved to a local file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def get_revision(self):
+        """
+        Use the modification time and size of the file as its revision.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get_location(self):
+        return os.path.abspath(self.path)
+
+
+class CsvSink(FileSink):
+    """
+    Save the results to a CSV file.
+    """
+
+    name = "CSV File"
+
+    def clear(self):
+        open(self.path, "w", encoding="utf-8").close()
+
+    def append_rows(self, rows):
+        with open(self.path, "a", newline="", encoding="utf-8") as file:
+            csv.writer(file).writerows(rows)
+
+    def read_rows(self):
+        try:
+            with open(self.path, newline="", encoding="utf-8") as file:
+                return list(csv.reader(file))
+        except OSError:
+            return []
+
+
+class JsonLinesSink(FileSink):
+    """
+    Save the results to a JSON Lines file, one object per link.
+    """
+
+    name = "JSON Lines File"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.header = None
+
+    def clear(self):
+        open(self.path, "w", encoding="utf-8").close()
+        self.header = None
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        if self.header is None and rows:
+            # The first row written after clear() is the header
+            self.header = rows.pop(0)
+        with open(self.path, "a", encoding="utf-8") as file:
+            for row in rows:
+                file.write(json.dumps(dict(zip(self.header, row))) + "\n")
+
+    def read_rows(self):
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                records = [json.loads(line) for line in file if line.strip()]
+        except (OSError, ValueError):
+            return []
+        if not records:
+            return []
+        header = list(records[0])
+        return [header] + [
+            [record.get(column, "") for column in header]
+            for record in records
+        ]
+
+
+class SqliteSink(FileSink):
+    """
+    Save the results to a table in an SQLite database.
+    """
+
+    name = "SQLite Database"
+    table = "results"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.header = None
+
+    def connect(self):
+        """
+        Open a connection to the database.
+        """
+        return sqlite3.connect(self.path)
+
+    def clear(self):
+        with closing(self.connect()) as connection, connection:
+            connection.execute(f'DROP TABLE IF EXISTS "{self.table}"')
+        self.header = None
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        with closing(self.connect()) as connection, connection:
+            if self.header is None and rows:
+                # The first row written after clear() is the header
+                self.header = rows.pop(0)
+                columns = ", ".join(f'"{column}"' for column in self.header)
+                connection.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{self.table}" ({columns})'
+                )
+            placeholders = ", ".join("?" for _ in self.header)
+            connection.executemany(
+                f'INSERT INTO "{self.table}" VALUES ({placeholders})', rows
+            )
+
+    def read_rows(self):
+        try:
+            with closing(self.connect()) as connection:
+                cursor = connection.execute(
+                    f'SELECT * FROM "{self.table}" ORDER BY rowid'
+                )
+                header = [column[0] for column in cursor.description]
+                return [header] + [list(row) for row in cursor]
+        except sqlite3.Error:
+            return []
+
+
+class StreamSink(ResultSink):
+    """
+    Write the results to an open text stream such as stdout, as CSV or
+    JSON Lines. The results can't be read back.
+    """
+
+    name = "Output"
+
+    def __init__(self, stream, output_format="csv"):
+        self.stream = stream
+        self.output_format = output_format
+        self.header = None
+
+    def clear(self):
+        self.header = None
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        if self.header is None and rows:
+            # The first row written after clear() is the header
+            self.header = rows[0]
+            if self.output_format == "jsonl":
+                rows.pop(0)
+        if self.output_format == "jsonl":
+            for row in rows:
+                self.stream.write(json.dumps(dict(zip(self.header, row))))
+                self.stream.write("\n")
+        else:
+            csv.writer(self.stream).writerows(rows)
+        self.stream.flush()
+
+    def read_rows(self):
+        return []
+
+    def get_location(self):
+        return getattr(self.stream, "name", "")
+
+
+class GoogleSheetsSink(ResultSink):
+    """
+    Save the results to the first worksheet of a Google Sheet.
+    The client is only authorized the first time the sheet is used.
+    """
+
+    name = "Google Sheet"
+
+    def __init__(self, creds_file, sheet_name, scope, call_with_backoff):
+        self.creds_file = creds_file
+        self.sheet_name = sheet_name
+        self.scope = scope
+        # Wraps every API call to retry when the quota is exceeded
+        self.call_with_backoff = call_with_backoff
+        self.sheet = None
+
+    def get_sheet(self):
+        """
+        Authorize the Google Sheets client and open the spreadsheet.
+        """
+        if self.sheet is None:
+            creds = Credentials.from_service_account_file(self.creds_file)
+            scoped_creds = creds.with_scopes(self.scope)
+            client = gspread.authorize(scoped_creds)
+            self.sheet = client.open(self.sheet_name)
+        return self.sheet
+
+    def get_worksheet(self):
+        """
+        Get the worksheet that holds the results.
+        """
+        return self.get_sheet().sheet1
+
+    def clear(self):
+        self.call_with_backoff(self.get_worksheet().clear)
+
+    def append_rows(self, rows):
+        self.call_with_backoff(
+            self.get_worksheet().append_rows, rows, table_range="A1"
+        )
+
+    def read_rows(self):
+        return self.call_with_backoff(self.get_worksheet().get_all_values)
+
+    def get_revision(self):
+        """
+        Use the time the sheet was last modified as its revision.
+        """
+        try:
+            return self.get_sheet().get_lastUpdateTime()
+        except Exception:
+            return None
+
+    def get_location(self):
+        return self.get_sheet().url
+
+
+class ResultStore:
+    """
+    Column store of the saved results, built once when the rows are
+    read. Columns with few distinct values (type, status...) keep an
+    integer code per row into their list of categories, and the rows of
+    every category are indexed while the rows are read, so counting or
+    filtering the rows by value needs no further pass.
+    """
+
+    def __init__(self, rows, categorical_columns):
+        self.header = list(rows[0]) if rows else []
+        self.categorical = [
+            column for column in self.header if column in categorical_columns
+        ]
+        # Other columns (link, response...) are plain lists of values
+        self.values = {
+            column: []
+            for column in self.header
+            if column not in self.categorical
+        }
+        self.codes = {column: array("I") for column in self.categorical}
+        self.categories = {column: [] for column in self.categorical}
+        self.category_codes = {column: {} for column in self.categorical}
+        # Numbers of the rows of every category, by code
+        self.positions = {column: [] for column in self.categorical}
+        self.size = 0
+        self.load(rows[1:])
+
+    def __len__(self):
+        return self.size
+
+    def load(self, rows):
+        """
+        Append rows to the columns and indexes.
+        """
+        width = len(self.header)
+        # Sheets drop the empty cells at the end of a row
+        rows = [
+            row if len(row) >= width else list(row) + [""] * (width - len(row))
+            for row in rows
+        ]
+        for column, values in zip(self.header, zip(*rows)):
+            if column in self.values:
+                self.values[column].extend(values)
+                continue
+            category_codes = self.category_codes[column]
+            codes = [
+                category_codes.setdefault(value, len(category_codes))
+                for value in values
+            ]
+            self.codes[column].extend(codes)
+            # Codes are given in order, so new categories come last
+            categories = self.categories[column]
+            positions = self.positions[column]
+            for value in list(category_codes)[len(categories):]:
+                categories.append(value)
+                positions.append(array("I"))
+            append = [rows_of_code.append for rows_of_code in positions]
+            for position, code in enumerate(codes, self.size):
+                append[code](position)
+        self.size += len(rows)
+
+    def has_column(self, column):
+        """
+        Check if the results have a column (older results may not).
+        """
+        return column in self.header
+
+    def count(self, column, *values):
+        """
+        Count the rows whose column has one of the values.
+        """
+        if column not in self.category_codes:
+            return 0
+        codes = self.category_codes[column]
+        return sum(
+            len(self.positions[column][codes[value]])
+            for value in values
+            if value in codes
+        )
+
+    def find(self, column, *values):
+        """
+        Get the numbers of the rows whose column has one of the values,
+        in row order.
+        """
+        if column not in self.category_codes:
+            return []
+        codes = self.category_codes[column]
+        positions = [
+            self.positions[column][codes[value]]
+            for value in values
+            if value in codes
+        ]
+        if len(positions) == 1:
+            return list(positions[0])
+        return sorted(chain.from_iterable(positions))
+
+    def filter(self, positions, column, value):
+        """
+        Keep the rows whose column is value (ignoring case), or contains
+        it for columns that are not categorical.
+        Returns the numbers of the kept rows, in the order given.
+        """
+        value = value.lower()
+        if column in self.values:
+            values = self.values[column]
+            return [
+                position
+                for position in positions
+                if value in str(values[position]).lower()
+            ]
+        # Only the index of the matching categories is read
+        matches = set(
+            self.find(
+                column,
+                *(
+                    category
+                    for category in self.categories[column]
+                    if str(category).lower() == value
+                ),
+            )
+        )
+        return [position for position in positions if position in matches]
+
+    def sort(self, positions, column, reverse=False):
+        """
+        Sort row numbers by the value of a column.
+        """
+        if column in self.values:
+            return sorted(
+                positions, key=self.values[column].__getitem__, reverse=reverse
+            )
+        # Categorical rows are sorted by the rank of their category
+        categories = self.categories[column]
+        ranks = [0] * len(categories)
+        for rank, code in enumerate(
+            sorted(range(len(categories)), key=categories.__getitem__)
+        ):
+            ranks[code] = rank
+        codes = self.codes[column]
+        return sorted(
+            positions,
+            key=lambda position: ranks[codes[position]],
+            reverse=reverse,
+        )
+
+    def get(self, position, column):
+        """
+        Get the value of a column in a row.
+        """
+        if column in self.values:
+            return self.values[column][position]
+        return self.categories[column][self.codes[column][position]]
 
 
 class LinkValidator:
@@ -20,397 +1561,1888 @@ class LinkValidator:
     Initialize the LinkValidator class.
     """
 
-    def __init__(self):
-        # Constants
-        self.RED = Fore.RED
-        self.GREEN = Fore.GREEN
-        self.YELLOW = Fore.YELLOW
-        self.CYAN = Fore.CYAN
-        self.MAGENTA = Fore.MAGENTA
-        self.WHITE = Fore.WHITE
-        self.BLACK = Fore.BLACK
-        self.RESET = Style.RESET_ALL
-        self.ERROR_MESSAGE = (
-            self.RED
-            + "\nNo links found. Please scrape a webpage first."
-            + self.RESET
+    def __init__(self, interactive=True, sink="sheets", sink_path=None):
+        # Without the menu (CI, cron...) there are no prompts or colors
+        self.INTERACTIVE = interactive
+        # Constants
+        self.RED = Fore.RED if interactive else ""
+        self.GREEN = Fore.GREEN if interactive else ""
+        self.YELLOW = Fore.YELLOW if interactive else ""
+        self.CYAN = Fore.CYAN if interactive else ""
+        self.MAGENTA = Fore.MAGENTA if interactive else ""
+        self.WHITE = Fore.WHITE if interactive else ""
+        self.BLACK = Fore.BLACK if interactive else ""
+        self.RESET = Style.RESET_ALL if interactive else ""
+        self.ERROR_MESSAGE = (
+            self.RED
+            + "\nNo links found. Please scrape a webpage first."
+            + self.RESET
+        )
+        # Maximum number of links checked at the same time
+        self.MAX_WORKERS = 20
+        # Number of hosts to keep connection pools for
+        self.POOL_HOSTS = 100
+        # Number of keep-alive connections kept open per host
+        self.POOL_SIZE = 10
+        # Timers and counters of the scan (phase times, requests, bytes
+        # and latencies per host, cache hits)
+        self.COLLECT_METRICS = True
+        # Upper bounds in seconds of the request latency histograms
+        self.LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+        self.METRICS = ScanMetrics(self.COLLECT_METRICS, self.LATENCY_BUCKETS)
+        # Requests and connections of the pools closed so far, and the
+        # counts when the current scan started
+        self.closed_pool_counts = Counter()
+        self.scan_connection_counts = (0, 0)
+        # Shared session so connections are reused across a whole scan
+        self.SESSION = self.create_session()
+        # Politeness limits of every host: requests in flight, requests
+        # per second and burst size
+        self.HOST_MAX_CONNECTIONS = 4
+        self.HOST_RATE = 10
+        self.HOST_BURST = 10
+        # Read the robots.txt crawl-delay of every host checked
+        self.USE_ROBOTS_TXT = True
+        self.ROBOTS_TIMEOUT = 5
+        # Longest crawl-delay and Retry-After (in seconds) that are
+        # honoured; hosts asking for longer waits are reported as rate
+        # limited instead of stalling the scan
+        self.MAX_CRAWL_DELAY = 10
+        self.MAX_RETRY_AFTER = 60
+        # Retries of a link answered with 429 Too Many Requests (or 503
+        # with a Retry-After header), and the initial delay in seconds
+        # when the server doesn't say how long to wait
+        self.RATE_LIMIT_RETRIES = 2
+        self.RATE_LIMIT_BACKOFF = 1
+        # Seconds to wait for a connection and for each read of a response
+        self.CONNECT_TIMEOUT = 5
+        self.READ_TIMEOUT = 10
+        # Total seconds a link check may take, retries included
+        self.LINK_TIME_BUDGET = 30
+        # Retries of a link check after a 5xx response or connection
+        # error, and the initial backoff in seconds
+        self.CHECK_MAX_RETRIES = 2
+        self.CHECK_BACKOFF = 0.5
+        # Responses to HEAD that mean the server only supports GET
+        self.HEAD_FALLBACK_STATUSES = {403, 405, 501}
+        # Consecutive connection failures after which the links to a host
+        # fail fast as unreachable, seconds before the host is probed
+        # again, and seconds a DNS resolution is cached
+        self.CIRCUIT_FAILURE_THRESHOLD = 3
+        self.CIRCUIT_RESET_TIMEOUT = 30
+        self.DNS_CACHE_TTL = 300
+        self.HOST_HEALTH = HostHealth(
+            self.CIRCUIT_FAILURE_THRESHOLD,
+            self.CIRCUIT_RESET_TIMEOUT,
+            self.DNS_CACHE_TTL,
+            self.METRICS,
+        )
+        # New connections reuse the addresses resolved by HOST_HEALTH
+        self.HOST_HEALTH.install()
+        self.HOST_SCHEDULER = HostScheduler(
+            self.HOST_MAX_CONNECTIONS,
+            self.HOST_RATE,
+            self.HOST_BURST,
+            self.get_crawl_delay,
+        )
+        # Persistent cache of link statuses between runs
+        self.USE_CACHE = True
+        self.CACHE_FILE = "link_cache.json"
+        self.CACHE_MAX_ENTRIES = 10000
+        # Seconds each status class stays fresh in the cache
+        self.CACHE_TTL = {
+            "2xx": 7 * 24 * 60 * 60,
+            "3xx": 24 * 60 * 60,
+            "4xx": 60 * 60,
+            "5xx": 5 * 60,
+            "error": 5 * 60,
+        }
+        self.LINK_CACHE = LinkStatusCache(
+            self.CACHE_FILE, self.CACHE_TTL, self.CACHE_MAX_ENTRIES
+        )
+        # Redirects are followed up to this number of hops
+        self.MAX_REDIRECTS = 10
+        self.REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+        # Redirects seen so far, shared by all the link checks, and the
+        # seconds they are followed without asking the server again
+        self.REDIRECT_CACHE_MAX_ENTRIES = 10000
+        self.REDIRECT_CACHE_TTL = 600
+        self.REDIRECT_CACHE = RedirectCache(
+            self.REDIRECT_CACHE_MAX_ENTRIES, self.REDIRECT_CACHE_TTL
+        )
+        # Anchors of the pages scanned, reused when a page is unchanged.
+        # Pages are always revalidated, so the entries never stay fresh
+        self.PAGE_CACHE_FILE = "page_cache.json"
+        self.PAGE_CACHE_MAX_ENTRIES = 500
+        self.PAGE_CACHE = LinkStatusCache(
+            self.PAGE_CACHE_FILE, {}, self.PAGE_CACHE_MAX_ENTRIES
+        )
+        # Results of the last scans, compared by the incremental scans
+        self.SCAN_HISTORY_FILE = "scan_history.json"
+        self.SCAN_HISTORY_MAX_ENTRIES = 50
+        self.SCAN_HISTORY = ScanHistory(
+            self.SCAN_HISTORY_FILE, self.SCAN_HISTORY_MAX_ENTRIES
+        )
+        # HTML parser: "html.parser", "lxml" (if installed) or "stream"
+        self.PARSER = "html.parser"
+        # Limits of the whole-site crawl
+        self.CRAWL_MAX_DEPTH = 2
+        self.CRAWL_MAX_PAGES = 50
+        # Number of pages fetched at the same time while crawling
+        self.CRAWL_WORKERS = 5
+        # Processes parsing pages and pages downloaded at the same time
+        # in batch scans of many URLs
+        self.BATCH_PROCESSES = min(4, os.cpu_count() or 1)
+        self.BATCH_PAGE_WORKERS = 10
+        # Ports that are implied by the URL scheme
+        self.DEFAULT_PORTS = {"http": 80, "https": 443}
+        # Characters that never need to be percent-encoded
+        self.UNRESERVED_CHARACTERS = (
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            "abcdefghijklmnopqrstuvwxyz"
+            "0123456789-._~"
+        )
+        # Header of the results written in headless mode
+        self.RESULT_HEADER = [
+            "Page URL",
+            "Link URL",
+            "Type",
+            "Status",
+            "Response",
+            "Missing Aria",
+            "Reason",
+        ]
+        # Rows shown at a time by the result views
+        self.PAGE_SIZE = 20
+        # Maximum number of rows written to the result sink in one call
+        self.BATCH_SIZE = 500
+        # Seconds after which checked rows are written even if the batch
+        # isn't full, so partial results are saved while scanning
+        self.FLUSH_INTERVAL = 5
+        # Header of the results saved to the result sink
+        self.SHEET_HEADER = [
+            "Link URL",
+            "Type",
+            "Status",
+            "Response",
+            "Missing Aria",
+            "Reason",
+        ]
+        # Columns of the results with few distinct values, stored as
+        # categories by the result views
+        self.RESULT_CATEGORIES = [
+            "Page URL",
+            "Type",
+            "Status",
+            "Missing Aria",
+            "Reason",
+        ]
+        # Links resolved without a request, by scheme, and the reason codes
+        # of the links whose target was not verified
+        self.LOCAL_LINK_SCHEMES = {
+            "mailto": "Email address, not checked",
+            "tel": "Phone number, not checked",
+            "javascript": "JavaScript link, not checked",
+        }
+        self.UNVERIFIED_REASONS = {
+            "connection-error": "Connection errors",
+            "timeout": "Timeouts",
+            "unreachable": "Unreachable hosts",
+            "invalid-url": "Invalid URLs",
+            "mailto": "Email addresses",
+            "tel": "Phone numbers",
+            "javascript": "JavaScript links",
+            "unsupported-scheme": "Unsupported schemes",
+            "no-href": "Anchors without an href",
+        }
+        # Retries and initial delay (in seconds) when the API quota is hit
+        self.SHEET_MAX_RETRIES = 5
+        self.SHEET_BACKOFF = 1
+
+        self.SCOPE = [
+            "https://www.googleapis.com/auth/spreadsheets",
+            "https://www.googleapis.com/auth/drive.file",
+            "https://www.googleapis.com/auth/drive",
+        ]
+
+        # Google Sheets API credentials and spreadsheet
+        self.CREDS_FILE = "creds.json"
+        self.SHEET_NAME = "LinkValidator"
+        # Where the results are saved (created lazily, so no network here)
+        self.SINK = self.create_sink(sink, sink_path)
+
+        # Rows of the last scan, kept so the display options don't need
+        # to read the results again unless they changed remotely
+        self.results = None
+        self.results_store = None
+        self.results_revision = None
+
+        # Highest option of the main menu
+        self.MAX_MENU_CHOICE = 13
+        # The welcome message is shown once, above the first menu
+        self.welcome_shown = False
+
+        if interactive:
+            self.initialize_colorama()
+
+    def initialize_colorama(self):
+        """
+        Initialize colorama and set the color for the welcome message.
+        """
+        colorama.init()
+
+    def create_sink(self, sink, sink_path=None):
+        """
+        Create the result sink: "sheets", "csv", "jsonl" or "sqlite".
+        """
+        if sink == "csv":
+            return CsvSink(sink_path or "results.csv")
+        if sink == "jsonl":
+            return JsonLinesSink(sink_path or "results.jsonl")
+        if sink == "sqlite":
+            return SqliteSink(sink_path or "results.db")
+        if sink == "sheets":
+            return GoogleSheetsSink(
+                self.CREDS_FILE,
+                self.SHEET_NAME,
+                self.SCOPE,
+                self.call_with_backoff,
+            )
+        raise ValueError(f"Unknown result sink: {sink}")
+
+    def create_session(self):
+        """
+        Create a requests session with a keep-alive connection pool per host.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_HOSTS,
+            pool_maxsize=self.POOL_SIZE,
+            # Wait for a free connection instead of opening extra ones
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Keep the counts of the pools evicted past POOL_HOSTS
+        pools = adapter.poolmanager.pools
+        dispose_pool = pools.dispose_func
+
+        def count_and_dispose(pool):
+            self.closed_pool_counts["requests"] += pool.num_requests
+            self.closed_pool_counts["connections"] += pool.num_connections
+            # urllib3 2 just drops evicted pools
+            if dispose_pool is not None:
+                dispose_pool(pool)
+
+        pools.dispose_func = count_and_dispose
+        # Count every request and its latency in the scan metrics
+        session.hooks["response"].append(self.METRICS.record_response)
+        return session
+
+    def count_connections(self):
+        """
+        Count the requests sent and connections opened by the session
+        since it was created, including the pools closed since.
+        Returns a tuple of (requests, connections opened).
+        """
+        num_requests = self.closed_pool_counts["requests"]
+        num_connections = self.closed_pool_counts["connections"]
+        for adapter in set(self.SESSION.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                num_requests += pool.num_requests
+                num_connections += pool.num_connections
+        return num_requests, num_connections
+
+    def reset_metrics(self):
+        """
+        Start the metrics and connection counts of a new scan.
+        """
+        self.METRICS.reset()
+        self.scan_connection_counts = self.count_connections()
+
+    def get_connection_stats(self):
+        """
+        Count the requests sent and connections opened during the
+        current scan.
+        Returns a tuple of (requests, connections opened, connections reused).
+        """
+        num_requests, num_connections = self.count_connections()
+        num_requests -= self.scan_connection_counts[0]
+        num_connections -= self.scan_connection_counts[1]
+        return (
+            num_requests,
+            num_connections,
+            max(num_requests - num_connections, 0),
+        )
+
+    def get_crawl_delay(self, host):
+        """
+        Read the crawl-delay that the robots.txt of a host asks for.
+        Returns the delay in seconds, or None if there isn't one.
+        """
+        if not self.USE_ROBOTS_TXT:
+            return None
+        try:
+            with self.METRICS.phase("robots_txt"):
+                response = self.SESSION.get(
+                    host + "/robots.txt", timeout=self.ROBOTS_TIMEOUT
+                )
+        except requests.exceptions.RequestException:
+            return None
+        self.METRICS.add_bytes(response.url, len(response.content))
+        if response.status_code != 200:
+            return None
+        robots = urllib.robotparser.RobotFileParser()
+        robots.parse(response.text.splitlines())
+        # crawl_delay() ignores rules that were never marked as read
+        robots.modified()
+        crawl_delay = robots.crawl_delay("*")
+        if not crawl_delay:
+            return None
+        return min(float(crawl_delay), self.MAX_CRAWL_DELAY)
+
+    def get_retry_after(self, response):
+        """
+        Get the seconds to wait from the Retry-After header of a
+        response, which is either a number of seconds or an HTTP date.
+        Returns None if the header is missing or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return int(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(retry_at.timestamp() - timer.time(), 0)
+
+    def print_welcome_message(self):
+        """
+        Print the welcome message for the Link-Validator Tool.
+        """
+        print(
+            Style.BRIGHT
+            + Back.GREEN
+            + Fore.WHITE
+            + "\nWelcome to the Link-Validator Tool!\n"
+            + self.RESET
+            + self.YELLOW
+            + "\nThis tool allows you to scrape a webpage"
+            + " and validate all the links."
+            + self.RESET
+        )
+
+    def print_instructions(self):
+        """
+        Display the instructions for using the Link-Validator Tool.
+        """
+
+        print(self.GREEN + "Menu options:")
+        print(self.CYAN + "1. Scrape and Validate Links from a Webpage")
+        print("10. Crawl and Validate Links from a Whole Website")
+        print("11. Re-scan a Webpage and Show the Changes")
+        print("13. Validate Links from a List of Webpages")
+        print("-" * 63)
+        print(self.YELLOW + "Display Options:" + self.RESET)
+        print(self.CYAN + "   2. Display All Links Scraped")
+        print("   3. Display Links not Verified")
+        print("   4. Display Links with Missing Aria Labels")
+        print("   5. Display Broken Links")
+        print("   6. Display a Summary of Findings")
+        print("  12. Display Scan Metrics (Timings, Hosts and Caches)")
+        print("-" * 63)
+        print(self.YELLOW + "Manage Options:")
+        print(self.CYAN + f"   7. Empty the Links {self.SINK.name}")
+        print(f"   8. Open the {self.SINK.name}")
+        print("-" * 63)
+        print(self.YELLOW + "Source Code:")
+        print(self.CYAN + "   9. Open GitHub")
+        print("-" * 63)
+        print(self.RED + "0. Exit Program" + self.RESET)
+        print(self.CYAN + "-" * 63 + self.RESET)
+        print(
+            self.RED + "Note: Use Ctrl+C to exit at any time.\n" + self.RESET
+        )
+
+    def get_user_input(self):
+        """
+        Get the user's menu choice.
+        """
+        while True:
+            try:
+                choice = input(
+                    self.YELLOW
+                    + f"Enter your choice (0-{self.MAX_MENU_CHOICE}): "
+                    + self.RESET
+                )
+                # Convert input to integer
+                choice = int(choice)
+                if 0 <= choice <= self.MAX_MENU_CHOICE:
+                    return choice
+                else:
+                    print(
+                        self.RED
+                        + "Invalid choice. Please enter a number from 0 to"
+                        + f" {self.MAX_MENU_CHOICE}."
+                        + self.RESET
+                    )
+                    timer.sleep(2)
+                    self.main()
+            except ValueError:
+                print(
+                    self.RED
+                    + "Invalid input. Please enter a number."
+                    + self.RESET
+                )
+                timer.sleep(2)
+                self.main()
+
+    def get_base_url(self, url):
+        """
+        Extract the base URL from the given URL.
+        """
+        parsed_url = urllib.parse.urlparse(url)
+        # No path (like in "https://example.com/")
+        if not parsed_url.path:
+            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"
+        else:
+            # Check if the path ends with ".html"
+            if parsed_url.path.endswith(".html"):
+                # If it does, remove the last component (the HTML file)
+                # from the path
+                base_url = (
+                    f"{parsed_url.scheme}://{parsed_url.netloc}"
+                    f"{'/'.join(parsed_url.path.split('/')[:-1])}/"
+                )
+            else:
+                base_url = (
+                    f"{parsed_url.scheme}://{parsed_url.netloc}"
+                    f"{parsed_url.path.rstrip('/')}/"
+                )
+        return base_url
+
+    def add_url_scheme(self, url):
+        """
+        Add "https://" to a URL entered without a scheme.
+        """
+        if url.startswith(("http://", "https://")):
+            return url
+        return "https://" + url
+
+    def normalize_url(self, url):
+        """
+        Return the canonical form of a URL so equivalent links compare equal.
+        """
+        url = url.strip()
+        try:
+            parsed_url = urllib.parse.urlsplit(url)
+            scheme = parsed_url.scheme.lower()
+            # Only web links can be canonicalized
+            if scheme not in self.DEFAULT_PORTS:
+                return url
+            host = parsed_url.hostname or ""
+            port = parsed_url.port
+        except ValueError:
+            # Malformed URL (e.g. an invalid port), leave it as it is
+            return url
+
+        # Lowercase the host and drop the port if it is the default one
+        netloc = f"[{host}]" if ":" in host else host
+        if port and port != self.DEFAULT_PORTS[scheme]:
+            netloc += f":{port}"
+        if parsed_url.username:
+            userinfo = parsed_url.username
+            if parsed_url.password:
+                userinfo += f":{parsed_url.password}"
+            netloc = f"{userinfo}@{netloc}"
+
+        # Normalize the percent-encoding and remove trailing slashes
+        path = self.normalize_percent_encoding(
+            parsed_url.path, "/:@!$&'()*+,;="
+        )
+        path = path.rstrip("/") or "/"
+        query = self.normalize_percent_encoding(
+            parsed_url.query, "/?:@!$&'()*+,;="
+        )
+
+        # Fragments are never sent to the server, so strip them
+        return urllib.parse.urlunsplit((scheme, netloc, path, query, ""))
+
+    def normalize_percent_encoding(self, value, safe):
+        """
+        Use one percent-encoding for every equivalent spelling of a value.
+        """
+
+        def normalize_escape(match):
+            character = chr(int(match.group(1), 16))
+            # Decode escapes that didn't need encoding in the first place
+            if character in self.UNRESERVED_CHARACTERS:
+                return character
+            # Otherwise use uppercase hex digits
+            return "%" + match.group(1).upper()
+
+        value = re.sub(r"%([0-9A-Fa-f]{2})", normalize_escape, value)
+        # Encode any characters that are not allowed in a URL
+        return urllib.parse.quote(value, safe=safe + "%")
+
+    def call_with_backoff(self, func, *args, **kwargs):
+        """
+        Call a Google Sheets API function, retrying with exponential
+        backoff when the quota is exceeded or the server has an error.
+        """
+        for attempt in range(self.SHEET_MAX_RETRIES):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                # Only quota (429) and server (5xx) errors are retried
+                retryable = e.code == 429 or e.code >= 500
+                if not retryable or attempt == self.SHEET_MAX_RETRIES - 1:
+                    raise
+                delay = self.SHEET_BACKOFF * 2**attempt + random.uniform(0, 1)
+                print(
+                    self.YELLOW
+                    + "\nGoogle Sheets quota reached, retrying in"
+                    + f" {delay:.1f} seconds..."
+                    + self.RESET
+                )
+                timer.sleep(delay)
+
+    def store_results(self, rows):
+        """
+        Keep the rows just saved to the result sink together with the
+        revision of the sink, so the next view doesn't read them back.
+        """
+        self.results = rows
+        self.results_store = None
+        self.results_revision = self.SINK.get_revision()
+
+    def clear_results(self):
+        """
+        Forget the stored rows so the next view reads the sink again.
+        """
+        self.results = None
+        self.results_store = None
+        self.results_revision = None
+
+    def get_sheet_data(self):
+        """
+        Get all rows of the results, only reading the sink again when it
+        has changed since the rows were stored.
+        """
+        revision = self.SINK.get_revision()
+        if (
+            self.results is not None
+            and revision is not None
+            and revision == self.results_revision
+        ):
+            return self.results
+
+        # The results changed remotely (or nothing is stored yet)
+        rows = self.SINK.read_rows()
+        self.results = rows
+        self.results_store = None
+        self.results_revision = revision
+        return rows
+
+    def get_results_store(self, data):
+        """
+        Get the results as a ResultStore, reusing it while the rows are
+        unchanged.
+        """
+        if self.results_store is None or data is not self.results:
+            self.results_store = ResultStore(data, self.RESULT_CATEGORIES)
+        return self.results_store
+
+    def fetch_page(self, url, html_only=False, parse=None):
+        """
+        Fetch a webpage and extract its anchors with parse (by default
+        parse_anchors).
+        A page that hasn't changed since the last scan isn't downloaded
+        or parsed again, its stored anchors are reused.
+        Returns None if html_only is set and the page is not HTML.
+        """
+        if parse is None:
+            parse = self.parse_anchors
+        canonical_url = self.normalize_url(url)
+        entry = None
+        if self.USE_CACHE:
+            entry = self.PAGE_CACHE.get(canonical_url, allow_stale=True)
+        headers = self.get_conditional_headers(entry)
+
+        with self.METRICS.phase("fetch_page"):
+            with self.HOST_HEALTH.request(url), self.HOST_SCHEDULER.slot(url):
+                response = self.SESSION.get(
+                    url,
+                    headers=headers,
+                    timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+                )
+        self.METRICS.add_bytes(response.url, len(response.content))
+        if response.status_code == 304 and headers:
+            self.METRICS.count_cache("page", "revalidated")
+            return [Anchor(*anchor) for anchor in entry["anchors"]]
+        if self.USE_CACHE:
+            self.METRICS.count_cache("page", "miss")
+        # Raise an HTTPError if status code is not 200
+        response.raise_for_status()
+        if html_only and "html" not in response.headers.get(
+            "Content-Type", ""
+        ):
+            return None
+        # Links resolve against the page the redirects ended on, and are
+        # internal to its host
+        with self.METRICS.phase("parse"):
+            anchors = parse(
+                response.content, self.get_base_url(response.url)
+            )
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.USE_CACHE and (etag or last_modified):
+            self.PAGE_CACHE.set(
+                canonical_url,
+                "valid",
+                f"{response.status_code} {response.reason}",
+                self.PAGE_CACHE.get_status_class(response.status_code),
+                etag=etag,
+                last_modified=last_modified,
+                anchors=[list(anchor) for anchor in anchors],
+            )
+        return anchors
+
+    def get_conditional_headers(self, entry):
+        """
+        Get the headers that ask the server to only send a response if
+        the URL changed since the cache entry was stored.
+        Only valid entries are revalidated.
+        """
+        headers = {}
+        if entry is None or entry["status"] != "valid":
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def parse_anchors(self, content, base_url):
+        """
+        Parse the HTML of a webpage with the selected PARSER and extract
+        its anchors (see parse_anchors).
+        """
+        try:
+            return parse_anchors(content, base_url, self.PARSER)
+        except FeatureNotFound:
+            # The parser isn't installed (e.g. lxml), use the built-in one
+            print(
+                self.YELLOW
+                + f"\nThe {self.PARSER} parser is not installed,"
+                + " using html.parser instead."
+                + self.RESET
+            )
+            self.PARSER = "html.parser"
+            return parse_anchors(content, base_url, self.PARSER)
+
+    def count_page_anchors(self, anchors, aria_index):
+        """
+        Count the anchors with aria labels, without aria labels, the
+        external links and the links used both with and without aria
+        labels on a webpage.
+        """
+        num_with_aria = sum(1 for anchor in anchors if anchor.has_aria)
+        # Anchors without an href point to the page itself
+        num_external = sum(
+            1 for anchor in anchors if anchor.href and not anchor.internal
+        )
+        num_mixed_aria = sum(
+            1
+            for with_aria, without_aria in aria_index.values()
+            if with_aria and without_aria
+        )
+        return (
+            num_with_aria,
+            len(anchors) - num_with_aria,
+            num_external,
+            num_mixed_aria,
         )
-        self.initialize_colorama()
-        self.print_welcome_message()
 
-        self.SCOPE = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive.file",
-            "https://www.googleapis.com/auth/drive",
-        ]
+    def build_aria_index(self, anchors):
+        """
+        Count the anchors with and without aria labels of every link,
+        keyed by canonical URL.
+        Returns the canonical URL of every link and a dictionary mapping
+        each canonical URL to [anchors with aria, anchors without aria].
+        """
+        canonical_urls = {}
+        aria_index = {}
+        for anchor in anchors:
+            canonical_url = canonical_urls.get(anchor.url)
+            if canonical_url is None:
+                canonical_url = self.normalize_url(anchor.url)
+                canonical_urls[anchor.url] = canonical_url
+            counts = aria_index.setdefault(canonical_url, [0, 0])
+            counts[0 if anchor.has_aria else 1] += 1
+        return canonical_urls, aria_index
 
-        # Google Sheets API credentials
-        self.CREDS = Credentials.from_service_account_file("creds.json")
-        self.SCOPED_CREDS = self.CREDS.with_scopes(self.SCOPE)
-        self.GSPREAD_CLIENT = gspread.authorize(self.SCOPED_CREDS)
-        self.SHEET = self.GSPREAD_CLIENT.open("LinkValidator")
-        self.WORKSHEET = self.SHEET.sheet1
+    def classify_anchors(self, anchors):
+        """
+        Determine the type and missing aria of the links of a webpage.
+        A link is missing aria if any anchor to the same canonical URL
+        has no aria label.
+        Returns a dictionary mapping each link to (type, missing aria,
+        canonical URL, local result) and the aria index of the page. The
+        local result is the (status, response, reason) of links that are
+        resolved without a request (see classify_local_link), else None.
+        """
+        canonical_urls, aria_index = self.build_aria_index(anchors)
+        link_info = {}
+        for anchor in anchors:
+            info = link_info.get(anchor.url)
+            # An anchor without an href has the URL of the page, the
+            # page is still checked if a real link points to it
+            if info is not None and (
+                info[3] is None or info[3][2] != "no-href" or not anchor.href
+            ):
+                continue
+            canonical_url = canonical_urls[anchor.url]
+            link_type = "internal" if anchor.internal else "external"
+            missing_aria = "yes" if aria_index[canonical_url][1] else "no"
+            link_info[anchor.url] = (
+                link_type,
+                missing_aria,
+                canonical_url,
+                self.classify_local_link(anchor),
+            )
+        return link_info, aria_index
 
-    def initialize_colorama(self):
+    def classify_local_link(self, anchor):
         """
-        Initialize colorama and set the color for the welcome message.
+        Classify the links that need no request: anchors without an href,
+        in-page fragments, malformed URLs and links that are not web links
+        (mailto:, tel:, javascript:...).
+        Returns the (status, response, reason) of the link, or None if it
+        has to be checked.
         """
-        colorama.init()
+        if anchor.href is None:
+            return ("not checked", "Anchor without an href", "no-href")
+        if anchor.href.strip().startswith("#"):
+            # The page itself was just fetched
+            return ("valid", "In-page link", "fragment")
+        try:
+            scheme = urllib.parse.urlsplit(anchor.url).scheme.lower()
+        except ValueError as e:
+            # The href can't even be parsed, so it can't be requested
+            return ("broken", f"Invalid URL: {e}", "invalid-url")
+        if scheme in self.DEFAULT_PORTS:
+            return None
+        if scheme in self.LOCAL_LINK_SCHEMES:
+            return ("not checked", self.LOCAL_LINK_SCHEMES[scheme], scheme)
+        return (
+            "not checked",
+            f"Unsupported scheme: {scheme or 'none'}",
+            "unsupported-scheme",
+        )
+
+    def iter_scan_results(
+        self, start_url, max_depth=0, pages=None, recheck=None
+    ):
+        """
+        Scan a webpage, and with max_depth > 0 the internal pages it links
+        to, yielding a (page, link, type, status, response, missing aria,
+        reason) row as soon as each link has been checked. The page is
+        the first page the link was found on.
+        Fetching pages, parsing them and checking links run as
+        overlapping stages. The number of links with aria, without aria
+        and external links of every page are added to pages if given.
+        Links whose canonical URL is in recheck skip the status cache.
+        Raises a RequestException if the start page cannot be fetched.
+        """
+        if pages is None:
+            pages = {}
+        if recheck is None:
+            recheck = set()
+        # Every page is fetched and parsed only once
+        visited = {self.normalize_url(start_url)}
+        parsed_pages = [(start_url, 0, self.fetch_page(start_url))]
+
+        link_info = {}  # Type and missing aria of every link seen
+        link_pages = {}  # Page every link was first found on
+        canonical_results = {}  # Status of every checked target
+        waiting_links = {}  # Links waiting for the check of their target
+        page_futures = {}
+        page_executor = ThreadPoolExecutor(max_workers=self.CRAWL_WORKERS)
+        check_executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        checks = HostQueues(
+            check_executor, self.HOST_SCHEDULER, self.check_link_status
+        )
+        # No progress bar without the menu, it would flood CI logs
+        pbar = tqdm(
+            total=0,
+            desc=self.CYAN + "Checking links",
+            unit="link" + self.RESET,
+            disable=not self.INTERACTIVE,
+        )
+        try:
+            while True:
+                for page_url, depth, anchors in parsed_pages:
+                    if anchors is None:
+                        continue
+                    page_info, aria_index = self.classify_anchors(anchors)
+                    pages[page_url] = self.count_page_anchors(
+                        anchors, aria_index
+                    )
+
+                    for link, info in page_info.items():
+                        if link in link_info:
+                            continue
+                        link_info[link] = info
+                        link_pages[link] = page_url
+                        canonical_url = info[2]
+                        result = info[3]
+                        # The target was already checked for another link
+                        if result is None:
+                            result = canonical_results.get(canonical_url)
+                        if result is not None:
+                            status, response, reason = result
+                            yield (
+                                page_url,
+                                link,
+                                info[0],
+                                status,
+                                response,
+                                info[1],
+                                reason,
+                            )
+                            continue
+                        # Start checking the target right away
+                        if canonical_url not in waiting_links:
+                            waiting_links[canonical_url] = []
+                            target = urllib.parse.urldefrag(link)[0]
+                            checks.put(
+                                canonical_url,
+                                target,
+                                canonical_url not in recheck,
+                            )
+                            pbar.total += 1
+                        waiting_links[canonical_url].append(link)
+
+                    if depth >= max_depth:
+                        continue
+                    # Queue the internal pages that haven't been seen
+                    for anchor in anchors:
+                        if len(visited) >= self.CRAWL_MAX_PAGES:
+                            break
+                        if not anchor.internal or not anchor.url.startswith(
+                            ("http://", "https://")
+                        ):
+                            continue
+                        canonical_url = self.normalize_url(anchor.url)
+                        if canonical_url in visited:
+                            continue
+                        visited.add(canonical_url)
+                        next_url = urllib.parse.urldefrag(anchor.url)[0]
+                        future = page_executor.submit(
+                            self.fetch_page, next_url, True
+                        )
+                        page_futures[future] = (next_url, depth + 1)
+                parsed_pages = []
+
+                if not page_futures and checks.is_empty():
+                    break
+                for future in checks.wait(page_futures):
+                    if future in checks.futures:
+                        canonical_url = checks.pop(future)
+                        status, response, reason = future.result()
+                        canonical_results[canonical_url] = (
+                            status,
+                            response,
+                            reason,
+                        )
+                        pbar.update(1)
+                        # Emit the row of every link to this target
+                        for link in waiting_links.pop(canonical_url):
+                            link_type, missing_aria = link_info[link][:2]
+                            yield (
+                                link_pages[link],
+                                link,
+                                link_type,
+                                status,
+                                response,
+                                missing_aria,
+                                reason,
+                            )
+                    else:
+                        page_url, depth = page_futures.pop(future)
+                        try:
+                            parsed_pages.append(
+                                (page_url, depth, future.result())
+                            )
+                        except requests.exceptions.RequestException:
+                            # The page itself is reported by its link check
+                            continue
+        finally:
+            pbar.close()
+            # Stop right away if the scan was interrupted
+            page_executor.shutdown(wait=False, cancel_futures=True)
+            check_executor.shutdown(wait=False, cancel_futures=True)
+            # Keep the statuses for the next run
+            if self.USE_CACHE:
+                self.LINK_CACHE.save()
+                self.PAGE_CACHE.save()
+
+    def iter_batch_results(self, urls, failed_urls, pages=None):
+        """
+        Scan a list of webpages, yielding a (page, link, type, status,
+        response, missing aria, reason) row for every link of every page.
+        The rows are grouped per page: the rows of a page are yielded
+        together once all its links have been checked.
+        Pages are downloaded on threads (sharing the session, caches and
+        host scheduler) and parsed in a pool of BATCH_PROCESSES processes.
+        Link checks go through one queue shared by all pages, so a target
+        linked from many pages is only checked once.
+        The link counts of every page are added to pages if given, and
+        pages that cannot be fetched are added to failed_urls.
+        """
+        if pages is None:
+            pages = {}
+        # Scan every page once, in the order given
+        page_urls = {}
+        for url in urls:
+            page_urls.setdefault(self.normalize_url(url), url)
+
+        page_links = {}  # Type, missing aria and target of every link
+        pending_checks = {}  # Targets of every page still being checked
+        canonical_results = {}  # Status of every checked target
+        waiting_pages = {}  # Pages waiting for the check of a target
+        # The pool is started from a thread while the checks are
+        # running, so its processes are spawned rather than forked
+        parse_executor = ProcessPoolExecutor(
+            max_workers=self.BATCH_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_parse_worker,
+            initargs=(self.PARSER,),
+        )
+        page_executor = ThreadPoolExecutor(
+            max_workers=self.BATCH_PAGE_WORKERS
+        )
+        check_executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        checks = HostQueues(
+            check_executor, self.HOST_SCHEDULER, self.check_link_status
+        )
+
+        def parse_in_process(content, base_url):
+            return parse_executor.submit(
+                parse_page_anchors, content, base_url
+            ).result()
+
+        def iter_page_rows(page_url):
+            for link, info in page_links.pop(page_url).items():
+                status, response, reason = (
+                    info[3] or canonical_results[info[2]]
+                )
+                yield (
+                    page_url,
+                    link,
+                    info[0],
+                    status,
+                    response,
+                    info[1],
+                    reason,
+                )
+
+        page_futures = {
+            page_executor.submit(
+                self.fetch_page, url, False, parse_in_process
+            ): url
+            for url in page_urls.values()
+        }
+        # No progress bar without the menu, it would flood CI logs
+        pbar = tqdm(
+            total=0,
+            desc=self.CYAN + "Checking links",
+            unit="link" + self.RESET,
+            disable=not self.INTERACTIVE,
+        )
+        try:
+            while page_futures or not checks.is_empty():
+                for future in checks.wait(page_futures):
+                    if future in checks.futures:
+                        canonical_url = checks.pop(future)
+                        canonical_results[canonical_url] = future.result()
+                        pbar.update(1)
+                        # Emit the pages that were only waiting for this
+                        for page_url in waiting_pages.pop(canonical_url):
+                            pending_checks[page_url].discard(canonical_url)
+                            if not pending_checks[page_url]:
+                                del pending_checks[page_url]
+                                yield from iter_page_rows(page_url)
+                        continue
+
+                    page_url = page_futures.pop(future)
+                    try:
+                        anchors = future.result()
+                    except requests.exceptions.RequestException as e:
+                        print(
+                            f"Error: could not fetch {page_url}: {e}",
+                            file=sys.stderr,
+                        )
+                        failed_urls.append(page_url)
+                        continue
+                    page_info, aria_index = self.classify_anchors(anchors)
+                    pages[page_url] = self.count_page_anchors(
+                        anchors, aria_index
+                    )
+                    page_links[page_url] = page_info
+
+                    pending = set()
+                    for link, info in page_info.items():
+                        canonical_url = info[2]
+                        if (
+                            info[3] is not None
+                            or canonical_url in canonical_results
+                        ):
+                            continue
+                        pending.add(canonical_url)
+                        if canonical_url in waiting_pages:
+                            waiting_pages[canonical_url].append(page_url)
+                            continue
+                        # Not queued by any page yet
+                        waiting_pages[canonical_url] = [page_url]
+                        target = urllib.parse.urldefrag(link)[0]
+                        checks.put(canonical_url, target)
+                        pbar.total += 1
+                    if pending:
+                        pending_checks[page_url] = pending
+                    else:
+                        yield from iter_page_rows(page_url)
+        finally:
+            pbar.close()
+            # Stop right away if the scan was interrupted
+            page_executor.shutdown(wait=False, cancel_futures=True)
+            check_executor.shutdown(wait=False, cancel_futures=True)
+            parse_executor.shutdown(wait=False, cancel_futures=True)
+            if self.USE_CACHE:
+                self.LINK_CACHE.save()
+                self.PAGE_CACHE.save()
+
+    def stream_results(self, rows, sinks, header, console=True):
+        """
+        Write result rows to the sinks as they arrive, in batches of at
+        most BATCH_SIZE rows, and print each one to the console.
+        The rows received so far are saved if the scan is interrupted.
+        The rows written to the result sink are also kept for the views.
+        Returns the number of links, internal links, broken links, rate
+        limited links and links that were not verified.
+        """
+        link_index = header.index("Link URL")
+        type_index = header.index("Type")
+        status_index = header.index("Status")
+        response_index = header.index("Response")
+        reason_index = header.index("Reason")
+        counts = {
+            "links": 0,
+            "internal": 0,
+            "broken": 0,
+            "rate_limited": 0,
+            "not_verified": 0,
+        }
 
-        # Check internet connectivity
-        if not self.check_internet_connection():
+        # Clear existing data (including header)
+        for sink in sinks:
+            sink.clear()
+        batch = [header]
+        last_flush = timer.monotonic()
+        saved_rows = [] if self.SINK in sinks else None
+
+        def flush():
+            with self.METRICS.phase("write_results"):
+                for sink in sinks:
+                    sink.append_rows(batch)
+            if saved_rows is not None:
+                saved_rows.extend(batch)
+            batch.clear()
+
+        try:
+            for row in rows:
+                row = list(row)
+                if row[response_index] is None:
+                    row[response_index] = ""
+                batch.append(row)
+
+                counts["links"] += 1
+                if row[type_index] == "internal":
+                    counts["internal"] += 1
+                if row[status_index] == "broken":
+                    counts["broken"] += 1
+                elif row[status_index] == "rate limited":
+                    counts["rate_limited"] += 1
+                if row[reason_index] in self.UNVERIFIED_REASONS:
+                    counts["not_verified"] += 1
+
+                if console:
+                    color = {
+                        "broken": self.RED,
+                        "rate limited": self.YELLOW,
+                        "not checked": self.YELLOW,
+                    }.get(row[status_index], self.GREEN)
+                    tqdm.write(
+                        color
+                        + row[status_index]
+                        + self.RESET
+                        + f" {row[link_index]} ({row[response_index]})"
+                    )
+
+                # Flush when the batch is full or hasn't been for a while
+                if (
+                    len(batch) >= self.BATCH_SIZE
+                    or timer.monotonic() - last_flush >= self.FLUSH_INTERVAL
+                ):
+                    flush()
+                    last_flush = timer.monotonic()
+        except KeyboardInterrupt:
+            # Stop the scan, then save what was checked so far
+            if hasattr(rows, "close"):
+                rows.close()
+            flush()
+            if saved_rows is not None:
+                self.store_results(saved_rows)
             print(
                 self.RED
-                + "\nError: No internet connection. Please"
-                + " check your network connection and try again."
+                + f"\nScan interrupted, {counts['links']} checked links"
+                + " were saved."
                 + self.RESET
             )
-            exit()
+            raise
+        if batch:
+            flush()
+        if saved_rows is not None:
+            self.store_results(saved_rows)
+        return counts
+
+    def get_recheck_urls(self, previous):
+        """
+        Get the canonical URLs of the links of the previous scan that were
+        not valid, which are checked again even if they are cached.
+        """
+        if not previous:
+            return set()
+        return {
+            self.normalize_url(link)
+            for link, result in previous.items()
+            if result[1] != "valid"
+        }
 
-    def check_internet_connection(self):
+    def record_scan_results(self, rows, results, link_index=0):
         """
-        Check internet connectivity.
+        Pass the result rows through, storing each one in results by link.
         """
         try:
-            requests.get("http://www.google.com", timeout=5)
-            return True
-        except requests.ConnectionError:
-            return False
-        except requests.Timeout:
+            for row in rows:
+                row = tuple(row)
+                results[row[link_index]] = list(row[link_index + 1:])
+                yield row
+        finally:
+            if hasattr(rows, "close"):
+                rows.close()
+
+    def diff_scan_results(self, previous, current):
+        """
+        Compare the results of a scan with the previous scan.
+        Returns a dictionary with the links that are newly broken, newly
+        fixed, added and removed.
+        """
+        diff = {"newly_broken": [], "newly_fixed": [], "added": []}
+        for link, result in current.items():
+            if link not in previous:
+                diff["added"].append(link)
+                continue
+            was_broken = previous[link][1] == "broken"
+            if result[1] == "broken" and not was_broken:
+                diff["newly_broken"].append(link)
+            elif result[1] == "valid" and was_broken:
+                diff["newly_fixed"].append(link)
+        diff["removed"] = [link for link in previous if link not in current]
+        return diff
+
+    def print_scan_diff(self, diff, file=None):
+        """
+        Print the changes since the previous scan.
+        """
+        sections = [
+            ("Newly broken links", "newly_broken", self.RED),
+            ("Newly fixed links", "newly_fixed", self.GREEN),
+            ("Added links", "added", self.CYAN),
+            ("Removed links", "removed", self.YELLOW),
+        ]
+        print(
+            self.CYAN + "\nChanges since the last scan:" + self.RESET,
+            file=file,
+        )
+        for title, key, color in sections:
+            print(color + f"{title}: {len(diff[key])}" + self.RESET, file=file)
+            for link in diff[key]:
+                print(f"   {link}", file=file)
+
+    def scan_and_save(self, url, max_depth=0, incremental=False):
+        """
+        Scan a webpage (or a website with max_depth > 0), stream the
+        results to the result sink and print a short summary.
+        An incremental scan only checks the links that are new, were not
+        valid or have expired from the cache, and prints the changes
+        since the previous scan.
+        """
+        pages = {}
+        history_key = self.normalize_url(url)
+        previous = None
+        if incremental:
+            previous = self.SCAN_HISTORY.get(history_key, max_depth)
+            if previous is None:
+                print(
+                    self.YELLOW
+                    + "No previous scan of this page, running a full scan."
+                    + self.RESET
+                )
+        current = {}
+        # The stored rows are replaced by the new scan
+        self.clear_results()
+        self.reset_metrics()
+        try:
+            rows = self.iter_scan_results(
+                url, max_depth, pages, self.get_recheck_urls(previous)
+            )
+            with self.METRICS.phase("scan"):
+                # The saved results have no page column
+                counts = self.stream_results(
+                    (
+                        row[1:]
+                        for row in self.record_scan_results(rows, current, 1)
+                    ),
+                    [self.SINK],
+                    self.SHEET_HEADER,
+                )
+        except requests.exceptions.RequestException as e:
             print(
-                "Connection timed out. Please check your"
-                + " internet connection and try again later."
+                self.RED
+                + f"An error occurred while fetching the webpage: {e}"
+                + self.RESET
             )
-            return False
+            return
+        except Exception as e:
+            print(
+                self.RED
+                + "An error occurred while writing data to the"
+                + f" {self.SINK.name}:",
+                str(e) + self.RESET,
+            )
+            return
 
-    def print_welcome_message(self):
+        print(
+            self.GREEN
+            + f"Data saved to the {self.SINK.name} successfully."
+            + self.RESET
+        )
+        # Keep the results to compare the next incremental scan against
+        self.SCAN_HISTORY.set(history_key, max_depth, current)
+        self.SCAN_HISTORY.save()
+        if max_depth:
+            print(self.CYAN + "Pages crawled:", str(len(pages)) + self.RESET)
+        self.print_scan_summary(counts, pages)
+        if previous is not None:
+            self.print_scan_diff(self.diff_scan_results(previous, current))
+
+    def print_scan_summary(self, counts, pages):
         """
-        Print the welcome message for the Link-Validator Tool.
+        Print a short summary of the last scan.
         """
-        # Clear the console
-        self.clear_console()
+        print(self.GREEN + "Scraping complete!\n" + self.RESET)
+        print(self.CYAN + "Total links found:", counts["links"])
         print(
-            Style.BRIGHT
-            + Back.GREEN
-            + Fore.WHITE
-            + "\nWelcome to the Link-Validator Tool!\n"
+            "Links with aria labels:",
+            sum(page[0] for page in pages.values()),
+        )
+        print(
+            "Links without aria labels:",
+            sum(page[1] for page in pages.values()),
+        )
+        print(
+            "External links found:", sum(page[2] for page in pages.values())
+        )
+        print(
+            "Links used with and without aria labels:",
+            sum(page[3] for page in pages.values()),
+        )
+        print("Internal links found:", counts["internal"])
+        print("Broken links found:", counts["broken"])
+        if counts["rate_limited"]:
+            print("Links not checked (rate limited):", counts["rate_limited"])
+        print("Links not verified:", counts["not_verified"])
+        unreachable_hosts = self.HOST_HEALTH.get_unreachable_hosts()
+        if unreachable_hosts:
+            # Their remaining links were reported without a request
+            print("Unreachable hosts:", ", ".join(unreachable_hosts))
+
+        if self.METRICS.enabled:
+            phases = self.METRICS.to_dict()["phases"]
+
+            def get_seconds(name):
+                return phases.get(name, {}).get("seconds", 0)
+
+            print(
+                f"Time: scan {get_seconds('scan'):.2f} s | fetching pages"
+                f" {get_seconds('fetch_page'):.2f} s | parsing"
+                f" {get_seconds('parse'):.2f} s | writing results"
+                f" {get_seconds('write_results'):.2f} s"
+            )
+
+        # Show how well keep-alive connections were reused
+        num_requests, num_opened, num_reused = self.get_connection_stats()
+        print(
+            "Requests sent:",
+            num_requests,
+            "| Connections opened:",
+            num_opened,
+            "| Connections reused:",
+            num_reused,
+        )
+
+        print(
+            self.GREEN
+            + f"\nPlease check the {self.SINK.name} for more details."
             + self.RESET
-            + self.YELLOW
-            + "\nThis tool allows you to scrape a webpage"
-            + " and validate all the links."
+        )
+        print(
+            self.RED
+            + f"Note: The {self.SINK.name} will be emptied"
+            + " when you scrape a new webpage."
             + self.RESET
         )
-        print(self.CYAN + "\nLoading..." + self.RESET)
-        timer.sleep(3)
 
-    def print_instructions(self):
+    def scrape_and_validate_links(self):
         """
-        Display the instructions for using the Link-Validator Tool.
+        Scrape and validate links from a webpage.
         """
+        url = self.get_url_input()
+        print(self.CYAN + "You entered: " + url + self.RESET)
+
+        # Print the current page being scraped
+        print(f"\nScraping {url}...")
+        self.scan_and_save(url)
+
+    def batch_validate_links(self):
+        """
+        Validate the links of a list of webpages, saving the results
+        grouped per page.
+        """
+        urls = self.get_url_list_input()
+        print(self.CYAN + f"You entered {len(urls)} URLs." + self.RESET)
+
+        print(f"\nScanning {len(urls)} webpages...")
+        pages = {}
+        failed_urls = []
+        self.clear_results()
+        self.reset_metrics()
+        try:
+            with self.METRICS.phase("scan"):
+                counts = self.stream_results(
+                    self.iter_batch_results(urls, failed_urls, pages),
+                    [self.SINK],
+                    self.RESULT_HEADER,
+                )
+        except Exception as e:
+            print(
+                self.RED
+                + "An error occurred while writing data to the"
+                + f" {self.SINK.name}:",
+                str(e) + self.RESET,
+            )
+            return
 
-        print(self.GREEN + "Menu options:")
-        print(self.CYAN + "1. Scrape and Validate Links from a Webpage")
-        print("-" * 63)
-        print(self.YELLOW + "Display Options:" + self.RESET)
-        print(self.CYAN + "   2. Display All Links Scraped")
-        print("   3. Display Links not Verified due to Connection Errors")
-        print("   4. Display Links with Missing Aria Labels")
-        print("   5. Display Broken Links")
-        print("   6. Display a Summary of Findings")
-        print("-" * 63)
-        print(self.YELLOW + "Manage Options:")
-        print(self.CYAN + "   7. Empty the Links Google Sheet")
-        print("   8. Open Google Sheets")
-        print("-" * 63)
-        print(self.YELLOW + "Source Code:")
-        print(self.CYAN + "   9. Open GitHub")
-        print("-" * 63)
-        print(self.RED + "0. Exit Program" + self.RESET)
-        print(self.CYAN + "-" * 63 + self.RESET)
         print(
-            self.RED + "Note: Use Ctrl+C to exit at any time.\n" + self.RESET
+            self.GREEN
+            + f"Data saved to the {self.SINK.name} successfully."
+            + self.RESET
         )
+        print(self.CYAN + "Pages scanned:", str(len(pages)) + self.RESET)
+        if failed_urls:
+            print(
+                self.RED
+                + f"Pages that could not be fetched: {len(failed_urls)}"
+                + self.RESET
+            )
+        self.print_scan_summary(counts, pages)
 
-    def get_user_input(self):
+    def incremental_scan_links(self):
         """
-        Get the user's menu choice.
+        Scan a webpage again, only checking the links that may have
+        changed, and show the changes since its previous scan.
         """
-        while True:
-            try:
-                choice = input(
-                    self.YELLOW
-                    + "Enter your choice (1, 2, 3, 4, 5, 6, 7, 8, 9 or 0): "
-                    + self.RESET
-                )
-                # Convert input to integer
-                choice = int(choice)
-                if choice in [1, 2, 3, 4, 5, 6, 7, 8, 9, 0]:
-                    return choice
-                else:
-                    print(
-                        self.RED
-                        + "Invalid choice."
-                        + " Please enter 1, 2, 3, 4, 5, 6, 7, 8, 9 or 0."
-                        + self.RESET
-                    )
-                    timer.sleep(2)
-                    self.main()
-            except ValueError:
-                print(
-                    self.RED
-                    + "Invalid input. Please enter a number."
-                    + self.RESET
-                )
-                timer.sleep(2)
-                self.main()
+        url = self.get_url_input()
+        print(self.CYAN + "You entered: " + url + self.RESET)
+
+        print(f"\nScanning the changes of {url}...")
+        self.scan_and_save(url, incremental=True)
+
+    def crawl_and_validate_links(self):
+        """
+        Crawl a whole website and validate the links of every page.
+        """
+        url = self.get_url_input()
+        print(self.CYAN + "You entered: " + url + self.RESET)
+
+        print(
+            f"\nCrawling {url} (depth {self.CRAWL_MAX_DEPTH},"
+            f" up to {self.CRAWL_MAX_PAGES} pages)..."
+        )
+        self.scan_and_save(url, self.CRAWL_MAX_DEPTH)
 
-    def get_base_url(self, url):
+    def iter_headless_rows(
+        self, urls, max_depth, failed_urls, incremental=False, diffs=None
+    ):
         """
-        Extract the base URL from the given URL.
+        Scan each URL in turn, yielding its rows with the page URL first.
+        URLs whose page cannot be fetched are added to failed_urls.
+        The results of every scan are kept in the scan history; with
+        incremental, the changes since the previous scan of each URL are
+        added to diffs.
         """
-        parsed_url = urllib.parse.urlparse(url)
-        # No path (like in "https://example.com/")
-        if not parsed_url.path:
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-        else:
-            # Check if the path ends with ".html"
-            if parsed_url.path.endswith(".html"):
-                # If it does, remove the last component (the HTML file)
-                # from the path
-                base_url = (
-                    f"{parsed_url.scheme}://{parsed_url.netloc}"
-                    f"{'/'.join(parsed_url.path.split('/')[:-1])}/"
-                )
-            else:
-                base_url = (
-                    f"{parsed_url.scheme}://{parsed_url.netloc}"
-                    f"{parsed_url.path.rstrip('/')}/"
+        for url in urls:
+            url = self.add_url_scheme(url)
+            print(f"Scanning {url}...", file=sys.stderr)
+            history_key = self.normalize_url(url)
+            previous = None
+            if incremental:
+                previous = self.SCAN_HISTORY.get(history_key, max_depth)
+            current = {}
+            try:
+                rows = self.iter_scan_results(
+                    url,
+                    max_depth,
+                    recheck=self.get_recheck_urls(previous),
                 )
-        return base_url
+                yield from self.record_scan_results(rows, current, 1)
+            except requests.exceptions.RequestException as e:
+                print(f"Error: could not fetch {url}: {e}", file=sys.stderr)
+                failed_urls.append(url)
+                continue
+            self.SCAN_HISTORY.set(history_key, max_depth, current)
+            self.SCAN_HISTORY.save()
+            if previous is not None and diffs is not None:
+                diffs[url] = self.diff_scan_results(previous, current)
 
-    def write_to_google_sheets(self, data):
+    def run_headless(
+        self,
+        urls,
+        output=None,
+        output_format="csv",
+        crawl=False,
+        save_to_sink=False,
+        incremental=False,
+        diff_output=None,
+        metrics_output=None,
+        metrics_format="json",
+        batch=False,
+    ):
         """
-        Write data to Google Sheets.
+        Scan the given URLs without any prompts or delays and stream the
+        results to stdout or to the output file (and to the result sink
+        if save_to_sink is set).
+        With incremental, only the links that may have changed are
+        checked and the changes since the previous scans are printed to
+        stderr (and written to diff_output as JSON if given).
+        The scan metrics are written to metrics_output if given, as JSON
+        or Prometheus text.
+        With batch, the pages are scanned together: parsed in a process
+        pool, with each target checked once for all the pages.
+        Returns the exit code: 0 if every link is valid, 1 if broken links
+        were found and 2 if a page could not be fetched.
         """
-        try:
-            # Define the header row
-            header = [
-                "Link URL",
-                "Type",
-                "Status",
-                "Response",
-                "Missing Aria",
-            ]
+        if output and output_format == "jsonl":
+            sinks = [JsonLinesSink(output)]
+        elif output:
+            sinks = [CsvSink(output)]
+        else:
+            sinks = [StreamSink(sys.stdout, output_format)]
+        if save_to_sink:
+            sinks.append(self.SINK)
 
-            # Clear existing data (including header)
-            self.WORKSHEET.clear()
-
-            # Write the header row to the worksheet
-            self.WORKSHEET.append_row(header)
-
-            # Append new data with status, response, and missing aria
-            with tqdm(
-                total=len(data),
-                desc=self.CYAN + "Saving data to Google Sheets",
-                unit="row" + self.RESET,
-            ) as pbar:
-                for link, link_info in data.items():
-                    link_type, status, response, missing_aria = (
-                        link_info  # Unpack all four values
-                    )
+        failed_urls = []
+        max_depth = self.CRAWL_MAX_DEPTH if crawl else 0
+        diffs = {}
+        self.reset_metrics()
+        if batch:
+            urls = [self.add_url_scheme(url) for url in urls]
+            print(f"Scanning {len(urls)} pages...", file=sys.stderr)
+            rows = self.iter_batch_results(urls, failed_urls)
+        else:
+            rows = self.iter_headless_rows(
+                urls, max_depth, failed_urls, incremental, diffs
+            )
+        with self.METRICS.phase("scan"):
+            counts = self.stream_results(
+                rows,
+                sinks,
+                self.RESULT_HEADER,
+                console=False,
+            )
 
-                    # Add data row to the worksheet
-                    self.WORKSHEET.append_row(
-                        [
-                            link,
-                            link_type,
-                            status,
-                            response if response is not None else "",
-                            missing_aria,
-                        ]
-                    )
-                    pbar.update(1)
+        print(
+            f"Links checked: {counts['links']},"
+            f" broken links: {counts['broken']}",
+            file=sys.stderr,
+        )
+        for url, diff in diffs.items():
+            print(f"\n{url}", file=sys.stderr)
+            self.print_scan_diff(diff, file=sys.stderr)
+        if diff_output:
+            with open(diff_output, "w", encoding="utf-8") as file:
+                json.dump(diffs, file, indent=2)
+        if metrics_output:
+            self.METRICS.save(metrics_output, metrics_format)
+        if failed_urls:
+            return 2
+        return 1 if counts["broken"] else 0
 
-            print(
-                self.GREEN
-                + "Data saved to Google Sheets successfully."
-                + self.RESET
+    def check_link_status(self, link, use_cache=True):
+        """
+        Check the status of a link. Redirects are followed, so a link
+        that redirects gets the status of its final URL.
+        With use_cache off the link is checked even if its status is
+        cached.
+        """
+        # Links that are fresh in the cache skip the network entirely
+        canonical_url = self.normalize_url(link)
+        headers = {}
+        if self.USE_CACHE and use_cache:
+            entry = self.LINK_CACHE.get(canonical_url)
+            # Entries stored before reason codes are checked again
+            if entry and "reason" in entry:
+                self.METRICS.count_cache("link", "hit")
+                return self.get_entry_result(entry)
+            # Stale valid links are revalidated with a conditional request
+            headers = self.get_conditional_headers(
+                self.LINK_CACHE.get(canonical_url, allow_stale=True)
             )
-        except Exception as e:
-            print(
-                self.RED + "An unexpected error occurred:",
-                str(e) + self.RESET,
+
+        try:
+            redirect_key = urllib.parse.urldefrag(link)[0]
+            with self.REDIRECT_CACHE.lock_url(redirect_key):
+                # A redirect seen before is followed without a request
+                location = self.REDIRECT_CACHE.get(redirect_key)
+                if location is None:
+                    with self.METRICS.phase("check_link"):
+                        response = self.send_link_request(link, headers)
+                    if self.USE_CACHE:
+                        revalidated = response.status_code == 304
+                        self.METRICS.count_cache(
+                            "link", "revalidated" if revalidated else "miss"
+                        )
+                    location = self.get_redirect_location(link, response)
+                    if location is None:
+                        entry = self.store_response_result(
+                            canonical_url, response, headers
+                        )
+                        return self.get_entry_result(entry)
+                    self.REDIRECT_CACHE.set(redirect_key, location)
+            return self.follow_redirects(
+                canonical_url, link, location, use_cache
             )
+        except HostUnreachable as e:
+            # Not cached: the link is checked again once the host is back
+            return ("broken", str(e), "unreachable")
+        except requests.exceptions.RequestException as e:
+            # Broken link due to connection error
+            entry = self.LINK_CACHE.set(
+                canonical_url,
+                "broken",
+                str(e),
+                "error",
+                reason=self.get_request_error_reason(e),
+            )
+        return self.get_entry_result(entry)
 
-    def is_internal_link(self, link, base_url):
+    def get_entry_result(self, entry):
         """
-        Check if a link is internal based on the base URL.
+        Get the (status, response, reason) of a link from its cache entry.
         """
-        parsed_link = urllib.parse.urlparse(link)
-        parsed_base_url = urllib.parse.urlparse(base_url)
-        return parsed_link.netloc == parsed_base_url.netloc
+        return (entry["status"], entry["response"], entry["reason"])
 
-    def check_external_links(self, soup, base_url):
+    def get_request_error_reason(self, error):
         """
-        Check external links found in the webpage.
+        Get the reason code of a request that failed with an exception.
         """
-        external_links = []
-
-        # Find all the links on the page
-        all_links = soup.find_all("a")
+        if isinstance(error, HostUnreachable):
+            return "unreachable"
+        # Checked first, as a connect timeout is also a connection error
+        if isinstance(error, requests.exceptions.Timeout):
+            return "timeout"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "connection-error"
+        # Missing or unsupported scheme, invalid host...
+        return "invalid-url"
 
-        # Loop through all the links and get the href attribute
-        for link in all_links:
-            # Get the href attribute of the link
-            href = link.get("href")
-            # Check if href is not None and is not an empty string
-            if href:
-                # Create absolute URL using base_url and href
-                full_link = urllib.parse.urljoin(base_url, href)
-                # Check if the full link is an external link
-                if not self.is_internal_link(base_url, full_link):
-                    # This is an external link
-                    external_links.append(full_link)
-        return external_links
-
-    def scrape_and_validate_links(self):
+    def store_response_result(self, canonical_url, response, headers=None):
         """
-        Scrape and validate links from a webpage.
+        Get the status of a URL from the response to its check and store
+        it in the cache.
+        Returns the cache entry.
         """
-        url = self.get_url_input()
-        print(self.CYAN + "You entered: " + url + self.RESET)
+        headers = headers or {}
+        status_code = response.status_code
+        if status_code == 429:
+            # The host is still limiting requests after the retries,
+            # which says nothing about the link itself
+            return self.LINK_CACHE.set(
+                canonical_url,
+                "rate limited",
+                f"{status_code} {response.reason}",
+                "error",
+                reason="rate-limited",
+            )
+        if status_code >= 400:
+            # Broken link (404 Not Found)
+            result = ("broken", f"{status_code} {response.reason}")
+        else:
+            # Valid link (status code < 400)
+            result = ("valid", f"{status_code} {response.reason}")
+        status_class = self.LINK_CACHE.get_status_class(status_code)
+        if status_code == 304:
+            # Not modified, the link is still as valid as before and
+            # keeps its validators if the server didn't resend them
+            status_class = "2xx"
+        return self.LINK_CACHE.set(
+            canonical_url,
+            *result,
+            status_class,
+            etag=response.headers.get("ETag", headers.get("If-None-Match")),
+            last_modified=response.headers.get(
+                "Last-Modified", headers.get("If-Modified-Since")
+            ),
+        )
 
-        # Clear existing data (including header)
-        self.WORKSHEET.clear()
+    def get_redirect_location(self, url, response):
+        """
+        Get the absolute URL a response redirects to, or None if it is
+        not a redirect.
+        """
+        location = response.headers.get("Location")
+        if response.status_code not in self.REDIRECT_STATUSES or not location:
+            return None
+        return urljoin(url, location)
 
-        # Print the current page being scraped
-        print(f"\nScraping {url}...")
+    def follow_redirects(self, canonical_url, link, location, use_cache=True):
+        """
+        Follow the redirects of a link, up to MAX_REDIRECTS hops, and
+        store the status of its final URL as the status of the link.
+        Hops in the redirect cache are not requested again, and a final
+        URL that is fresh in the cache is shared by all the links that
+        redirect to it. With use_cache off the final URL is checked even
+        if its status is cached.
+        Returns the (status, response, reason) of the link.
+        """
+        chain = [link]
+        # Redirects are tracked by exact URL, as canonical URLs ignore
+        # differences like a trailing slash that servers redirect for
+        visited = {urllib.parse.urldefrag(link)[0]}
+        url = location
+        while True:
+            redirect_key = urllib.parse.urldefrag(url)[0]
+            canonical_hop = self.normalize_url(url)
+            chain.append(url)
+            if redirect_key in visited:
+                entry = self.LINK_CACHE.set(
+                    canonical_url,
+                    "broken",
+                    "Redirect loop: " + " -> ".join(chain),
+                    "error",
+                    reason="redirect-loop",
+                )
+                return self.get_entry_result(entry)
+            if len(chain) - 1 > self.MAX_REDIRECTS:
+                entry = self.LINK_CACHE.set(
+                    canonical_url,
+                    "broken",
+                    f"More than {self.MAX_REDIRECTS} redirects from {link}",
+                    "error",
+                    reason="too-many-redirects",
+                )
+                return self.get_entry_result(entry)
+            visited.add(redirect_key)
 
-        # Extract base URL
-        base_url = self.get_base_url(url)
+            with self.REDIRECT_CACHE.lock_url(redirect_key):
+                next_location = self.REDIRECT_CACHE.get(redirect_key)
+                entry = None
+                # A URL equivalent to the link would find the status of
+                # the link itself
+                if (
+                    next_location is None
+                    and self.USE_CACHE
+                    and use_cache
+                    and canonical_hop != canonical_url
+                ):
+                    entry = self.LINK_CACHE.get(canonical_hop)
+                    if entry is not None and "reason" not in entry:
+                        entry = None
+                if next_location is None and entry is None:
+                    with self.METRICS.phase("check_link"):
+                        response = self.send_link_request(url)
+                    next_location = self.get_redirect_location(url, response)
+                    if next_location is not None:
+                        self.REDIRECT_CACHE.set(redirect_key, next_location)
+                    else:
+                        entry = self.store_response_result(
+                            canonical_hop, response
+                        )
+            if next_location is not None:
+                url = next_location
+                continue
+            break
 
-        try:
-            response = requests.get(url)
-            # Raise an HTTPError if status code is not 200
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-        except requests.exceptions.RequestException as e:
-            print(
-                self.RED
-                + f"An error occurred while fetching the webpage: {e}"
-                + self.RESET
-            )
-            return
+        # The final URL may itself redirect further (its cached entry
+        # can also be the one of an equivalent URL that redirects to it)
+        num_redirects = len(chain) - 1
+        final_url = entry.get("final_url", url)
+        if final_url != url:
+            num_redirects += entry.get("redirects", 0)
+        final_response = entry.get("final_response", entry["response"])
+        plural = "s" if num_redirects > 1 else ""
+        entry = self.LINK_CACHE.set(
+            canonical_url,
+            entry["status"],
+            f"{final_response} after {num_redirects} redirect{plural}"
+            + f" to {final_url}",
+            entry["status_class"],
+            redirects=num_redirects,
+            final_url=final_url,
+            final_response=final_response,
+            reason=entry["reason"],
+        )
+        return self.get_entry_result(entry)
 
-        data = {}  # Dictionary to store link data
-        links_with_aria = []  # List to store links with aria labels
-        links_without_aria = []  # List to store links without aria labels
-        if soup:
-            # Check all links for aria labels
-            for link in soup.find_all("a"):
-                href = link.get("href")
-                aria_label = link.get("aria-label")
-                # Join base URL with relative URL to get full URL
-                full_link = urljoin(base_url, href)
-                if aria_label:
-                    links_with_aria.append(full_link)
-                else:
-                    links_without_aria.append(full_link)
-
-            # Update data with missing aria labels for links with aria
-            for link in links_with_aria:
-                # Determine missing aria
-                missing_aria = "no" if link in links_with_aria else "yes"
-                # Get status code and response from check_link_status function
-                status, response = self.check_link_status(link)
-                data[str(link)] = ("internal", status, response, missing_aria)
-
-            # Update data with missing aria labels for links without aria
-            for link in links_without_aria:
-                # Determine missing aria
-                missing_aria = "yes" if link in links_without_aria else "no"
-                # Get status code and response from check_link_status function
-                status, response = self.check_link_status(link)
-                data[str(link)] = ("internal", status, response, missing_aria)
-            # Check external links
-            external_links = self.check_external_links(soup, base_url)
-
-            # Determine if links are internal or external
-            # and check for broken links
-            for link in external_links:
-                if self.is_internal_link(link, base_url):
-                    link_type = "internal"
-                else:
-                    link_type = "external"
-                # Determine missing aria
-                missing_aria = "yes" if link in links_without_aria else "no"
-                status = self.check_link_status(link)
-                data[str(link)] = (
-                    link_type,
-                    status[0],
-                    status[1],
-                    missing_aria,
-                )
-
-            # Write data to Google Sheets
+    def send_link_request(self, link, headers=None):
+        """
+        Send the request of a link check through the host scheduler,
+        following the request policy:
+        - connect and read timeouts, all within the LINK_TIME_BUDGET,
+        - retries with jittered backoff for 5xx and connection errors,
+        - retries after the Retry-After of hosts that rate limit,
+        - a ranged GET when the server doesn't support HEAD,
+        - no request to hosts that are unreachable (see HostHealth).
+        headers are sent with every request (e.g. conditional headers).
+        Raises a Timeout if the time budget of the link runs out, and
+        HostUnreachable if the host is down.
+        """
+        deadline = timer.monotonic() + self.LINK_TIME_BUDGET
+        method = "HEAD"
+        retries = 0
+        rate_limit_retries = 0
+        while True:
             try:
-                self.write_to_google_sheets(data)
-            except Exception as e:
-                print(
-                    self.RED
-                    + "An error occurred while writing data to Google Sheets:",
-                    str(e) + self.RESET,
-                )
+                # A slow answer doesn't mean that the host is down, only
+                # connection errors count towards its breaker
+                with self.HOST_HEALTH.request(link):
+                    with self.HOST_SCHEDULER.slot(link, deadline):
+                        # Time waiting for the slot counts in the budget
+                        timeout = self.get_request_timeout(link, deadline)
+                        response = self.send_check_request(
+                            method, link, timeout, headers
+                        )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ):
+                if retries == self.CHECK_MAX_RETRIES:
+                    raise
+                retries += 1
+                self.wait_before_retry(link, deadline, retries)
+                continue
 
-            print(self.GREEN + "Scraping complete!\n" + self.RESET)
-            print(self.CYAN + "Total links found:", len(data))
-            print("Links with aria labels:", len(links_with_aria))
-            print("Links without aria labels:", len(links_without_aria))
-            print("External links found:", len(external_links))
-            print(
-                "Internal links found:",
-                sum(1 for value in data.values() if value[0] == "internal"),
-            )
-            print(
-                "Broken links found:",
-                sum(1 for value in data.values() if value[1] == "broken"),
-            )
+            status_code = response.status_code
+            if method == "HEAD" and status_code in self.HEAD_FALLBACK_STATUSES:
+                # Some servers reject HEAD, ask for the first byte instead
+                method = "GET"
+                continue
 
-            # Count the number of connection errors
-            num_connection_errors = sum(
-                1
-                for value in data.values()
-                if "No connection adapters were found" in str(value[2])
+            delay = self.get_retry_after(response)
+            rate_limited = status_code == 429 or (
+                status_code == 503 and delay is not None
             )
-            print("Links with connection errors:", num_connection_errors)
+            if rate_limited:
+                if delay is None:
+                    delay = self.RATE_LIMIT_BACKOFF * 2**rate_limit_retries
+                if (
+                    rate_limit_retries == self.RATE_LIMIT_RETRIES
+                    or delay > self.MAX_RETRY_AFTER
+                    or timer.monotonic() + delay >= deadline
+                ):
+                    return response
+                rate_limit_retries += 1
+                # Hold back every request to this host, not only this one
+                self.HOST_SCHEDULER.defer(link, delay)
+                continue
 
-            print(
-                self.GREEN
-                + "\nPlease check the Google Sheets for more details."
-                + self.RESET
-            )
-            print(
-                self.RED
-                + "Note: The Google Sheets will be emptied"
-                + " when you scrape a new webpage."
-                + self.RESET
+            if status_code >= 500 and retries < self.CHECK_MAX_RETRIES:
+                retries += 1
+                self.wait_before_retry(link, deadline, retries)
+                continue
+            return response
+
+    def send_check_request(self, method, link, timeout, headers=None):
+        """
+        Send one request of a link check without downloading the body.
+        """
+        headers = dict(headers or {})
+        if method == "HEAD":
+            return self.SESSION.head(link, headers=headers, timeout=timeout)
+        # Redirects are reported like HEAD does, not followed
+        headers["Range"] = "bytes=0-0"
+        response = self.SESSION.get(
+            link,
+            headers=headers,
+            stream=True,
+            allow_redirects=False,
+            timeout=timeout,
+        )
+        response.close()
+        return response
+
+    def get_request_timeout(self, link, deadline):
+        """
+        Get the (connect, read) timeouts of the next request of a link
+        check, shortened to the time left in its budget.
+        Raises a Timeout if the budget has run out.
+        """
+        remaining = deadline - timer.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout(
+                f"Link check took longer than {self.LINK_TIME_BUDGET}"
+                + f" seconds: {link}"
             )
+        return (
+            min(self.CONNECT_TIMEOUT, remaining),
+            min(self.READ_TIMEOUT, remaining),
+        )
 
-    def check_link_status(self, link):
+    def wait_before_retry(self, link, deadline, retries):
         """
-        Check the status of a link.
+        Sleep before retrying a link check, with exponential backoff and
+        full jitter so retries to the same host don't arrive together.
+        Raises a Timeout if the wait would run out the time budget.
         """
-        try:
-            response = requests.head(link)
-            status_code = response.status_code
-            if status_code >= 400:
-                # Broken link (404 Not Found)
-                return ("broken", f"{status_code} {response.reason}")
-            else:
-                # Valid link (status code < 400)
-                return ("valid", f"{status_code} {response.reason}")
-        except requests.exceptions.RequestException as e:
-            return ("broken", str(e))  # Broken link due to connection error
+        delay = random.uniform(0, self.CHECK_BACKOFF * 2 ** (retries - 1))
+        if timer.monotonic() + delay >= deadline:
+            raise requests.exceptions.Timeout(
+                f"Link check took longer than {self.LINK_TIME_BUDGET}"
+                + f" seconds: {link}"
+            )
+        timer.sleep(delay)
 
     def display_all_links(self):
         """
@@ -423,28 +3455,175 @@ class LinkValidator:
         )
         try:
             # Fetch all data from the worksheet
-            data = self.WORKSHEET.get_all_values()
+            data = self.get_sheet_data()
 
             # Check if there is any data in the worksheet
             if not data or len(data) <= 1:
                 print(self.ERROR_MESSAGE)
                 return
 
-            # Convert data to DataFrame
-            df = pd.DataFrame(data[1:], columns=data[0])
+            # Rows are only read from the store when their page is shown
+            store = self.get_results_store(data)
+            self.browse_results(store, range(len(store)))
+
+        except Exception:
+            print(self.ERROR_MESSAGE)
+
+    def browse_results(self, store, positions, columns=None):
+        """
+        Show result rows page by page. Only the rows of the visible page
+        are read from the store and formatted. Results that fit on one
+        page are printed without a prompt.
+        The rows can be filtered and sorted by column, and the page size
+        changed, from the prompt under the page.
+        """
+        columns = [
+            column
+            for column in columns or store.header
+            if store.has_column(column)
+        ]
+        all_positions = positions
+        page_size = self.PAGE_SIZE
+        page = 0
+        filters = []
+        sort_column = None
+        while True:
+            num_pages = max(1, -(-len(positions) // page_size))
+            page = min(max(page, 0), num_pages - 1)
+            start = page * page_size
+            self.print_results_page(
+                store, positions[start:start + page_size], columns
+            )
+            if len(all_positions) <= page_size:
+                return
+            print(
+                self.CYAN
+                + f"\nRows {min(start + 1, len(positions))}-"
+                + f"{min(start + page_size, len(positions))} of"
+                + f" {len(positions)}, page {page + 1} of {num_pages}"
+                + "".join(f", {name} = {value}" for name, value in filters)
+                + (f", sorted by {sort_column}" if sort_column else "")
+                + self.RESET
+            )
+            try:
+                command = input(
+                    self.YELLOW
+                    + "Enter for next page, p for previous, a page number,"
+                    + " size N, sort [-]COLUMN, filter COLUMN=VALUE, clear"
+                    + " or q to quit: "
+                    + self.RESET
+                ).strip()
+            except EOFError:
+                return
+            name, _, argument = command.partition(" ")
+            name = name.lower()
+            if name in ("q", "quit"):
+                return
+            if name in ("", "n", "next"):
+                if page == num_pages - 1:
+                    return
+                page += 1
+            elif name in ("p", "previous"):
+                page -= 1
+            elif name.isdigit():
+                page = int(name) - 1
+            elif name == "size" and argument.strip().isdigit():
+                # Stay on the page of the first visible row
+                page_size = max(1, int(argument))
+                page = start // page_size
+            elif name == "sort":
+                reverse = argument.startswith("-")
+                column = self.match_result_column(
+                    columns, argument.lstrip("-")
+                )
+                if column is None:
+                    print(self.RED + "Unknown column." + self.RESET)
+                    continue
+                positions = store.sort(positions, column, reverse)
+                sort_column = ("-" if reverse else "") + column
+                page = 0
+            elif name == "filter" and "=" in argument:
+                column, value = argument.split("=", 1)
+                column = self.match_result_column(columns, column)
+                if column is None:
+                    print(self.RED + "Unknown column." + self.RESET)
+                    continue
+                positions = store.filter(positions, column, value.strip())
+                filters.append((column, value.strip()))
+                page = 0
+            elif name == "clear":
+                positions = all_positions
+                filters = []
+                sort_column = None
+                page = 0
+            else:
+                print(self.RED + "Invalid command." + self.RESET)
 
-            # Get terminal width
-            terminal_width = shutil.get_terminal_size().columns
+    def match_result_column(self, columns, name):
+        """
+        Find the column with a name, ignoring case.
+        Returns None if there is no such column.
+        """
+        name = name.strip().lower()
+        for column in columns:
+            if column.lower() == name:
+                return column
+        return None
 
-            # Truncate columns if the DataFrame exceeds terminal width
-            pd.set_option("display.max_columns", None)  # Show all columns
-            pd.set_option("display.width", terminal_width)  # Set display width
+    def print_results_page(self, store, positions, columns):
+        """
+        Print the rows of one page as a table that fits the terminal,
+        colored by status.
+        """
+        rows = [
+            [str(store.get(position, column)) for column in columns]
+            for position in positions
+        ]
+        numbers = [str(position + 1) for position in positions]
+        number_width = max([len(number) for number in numbers] + [1])
+        widths = [
+            max([len(column)] + [len(row[i]) for row in rows])
+            for i, column in enumerate(columns)
+        ]
+        # Shorten the widest columns until a row fits the terminal
+        available = (
+            shutil.get_terminal_size().columns
+            - number_width
+            - 2 * len(columns)
+        )
+        while sum(widths) > available and max(widths) > 10:
+            widths[widths.index(max(widths))] -= 1
 
-            # Display DataFrame
-            print(df)
+        def format_cells(cells):
+            return "  ".join(
+                (cell if len(cell) <= width else cell[: width - 3] + "...")
+                .ljust(width)
+                for cell, width in zip(cells, widths)
+            ).rstrip()
 
-        except Exception:
-            print(self.ERROR_MESSAGE)
+        status_index = columns.index("Status") if "Status" in columns else None
+        print(
+            self.CYAN
+            + " " * number_width
+            + "  "
+            + format_cells(columns)
+            + self.RESET
+        )
+        for number, row in zip(numbers, rows):
+            color = ""
+            if status_index is not None:
+                color = {
+                    "broken": self.RED,
+                    "rate limited": self.YELLOW,
+                    "not checked": self.YELLOW,
+                }.get(row[status_index], "")
+            print(
+                color
+                + number.rjust(number_width)
+                + "  "
+                + format_cells(row)
+                + (self.RESET if color else "")
+            )
 
     def get_url_input(self):
         """
@@ -486,10 +3665,7 @@ class LinkValidator:
                     timer.sleep(1)
                     self.main()
                     return
-                # Check if the URL starts with "http://" or "https://"
-                if not url.startswith(("http://", "https://")):
-                    # If not, add "http://" to the beginning of the URL
-                    url = "https://" + url
+                url = self.add_url_scheme(url)
                 if self.validate_url(url):
                     return url
                 else:
@@ -502,6 +3678,46 @@ class LinkValidator:
                 print(self.RED + "\nProgram terminated by user." + self.RESET)
                 exit()
 
+    def get_url_list_input(self):
+        """
+        Get a list of URLs from the user, typed in or read from a file
+        with one URL per line.
+        """
+        while True:
+            print(
+                self.RED
+                + "Note: Press 'm' to return to the main menu."
+                + self.RESET
+            )
+            value = input(
+                self.CYAN
+                + "\nEnter the URLs separated by spaces, or the path of a"
+                + " file with one URL per line: \n"
+                + self.RESET
+            ).strip()
+            if value.lower() == "m":
+                print(self.RED + "\nReturning to the main menu." + self.RESET)
+                timer.sleep(1)
+                self.main()
+                return
+            if os.path.isfile(value):
+                try:
+                    with open(value, encoding="utf-8") as file:
+                        urls = [
+                            line.strip()
+                            for line in file
+                            if line.strip() and not line.startswith("#")
+                        ]
+                except OSError as e:
+                    print(self.RED + f"Could not read {value}: {e}\n")
+                    continue
+            else:
+                urls = value.replace(",", " ").split()
+            if not urls:
+                print(self.RED + "Please enter at least one URL.\n")
+                continue
+            return [self.add_url_scheme(url) for url in urls]
+
     def validate_url(self, url):
         """
         Validate the URL by sending a HEAD request
@@ -509,16 +3725,32 @@ class LinkValidator:
         """
         # Send a HEAD request to the URL and check the status code
         try:
-            response = requests.head(
+            with self.SESSION.head(
                 url, allow_redirects=True, stream=True, timeout=5
-            )
-            print(
-                self.GREEN
-                + "\nStatus code: "
-                + str(response.status_code)
-                + self.RESET
-            )
-            return response.status_code == 200
+            ) as response:
+                print(
+                    self.GREEN
+                    + "\nStatus code: "
+                    + str(response.status_code)
+                    + self.RESET
+                )
+                # Keep the redirect chain for the link checks
+                for hop in response.history:
+                    location = self.get_redirect_location(hop.url, hop)
+                    if location is not None:
+                        self.REDIRECT_CACHE.set(
+                            urllib.parse.urldefrag(hop.url)[0], location
+                        )
+                if response.history:
+                    num_redirects = len(response.history)
+                    plural = "s" if num_redirects > 1 else ""
+                    print(
+                        self.YELLOW
+                        + f"Redirected {num_redirects} time{plural}"
+                        + f" to {response.url}"
+                        + self.RESET
+                    )
+                return response.status_code == 200
         except requests.exceptions.RequestException:
             self.clear_console()
             print(Back.RED + f"Error: {url}\n" + self.RESET)
@@ -530,19 +3762,28 @@ class LinkValidator:
 
     def open_google_sheet(self):
         """
-        Open the Google Sheet in a web browser.
+        Open the Google Sheet in a web browser, or show where the local
+        results file is.
         """
         try:
-            sheet_url = self.SHEET.url
-            os.system(f"start {sheet_url}")
+            location = self.SINK.get_location()
+            if not isinstance(self.SINK, GoogleSheetsSink):
+                print(self.CYAN + f"\n{self.SINK.name}: ")
+                print(location + self.RESET)
+                return
+            os.system(f"start {location}")
             print(self.CYAN + "\nLink to Google Sheet: ")
             print("https://rb.gy/ie05bn" + self.RESET)
         except Exception as e:
-            print(self.RED + "\nFailed to open Google Sheet:", e + self.RESET)
+            print(
+                self.RED + f"\nFailed to open the {self.SINK.name}:",
+                str(e) + self.RESET,
+            )
 
-    def display_missing_aria(self, missing_aria):
+    def display_missing_aria(self, store, missing_aria):
         """
-        Display links with missing aria labels.
+        Display links with missing aria labels, given the numbers of
+        their rows in the store.
         """
         try:
             if missing_aria:
@@ -552,8 +3793,7 @@ class LinkValidator:
                     + "Links with missing aria labels:"
                     + self.RESET
                 )
-                for link in missing_aria:
-                    print(link)
+                self.browse_results(store, missing_aria, ["Link URL", "Type"])
             else:
                 print(
                     "\n"
@@ -563,76 +3803,61 @@ class LinkValidator:
                 )
         except Exception as e:
             print(
-                "An error occurred while retrieving data from Google Sheets:",
+                "An error occurred while retrieving the results:",
                 str(e),
             )
 
     def display_missing_aria_links_from_sheet(self):
         """
-        Display links missing aria labels from the Google Sheets.
+        Display links missing aria labels from the saved results.
         """
         try:
-            # Retrieve data from the Google Sheets
-            data = self.WORKSHEET.get_all_values()
+            # Retrieve data from the result sink
+            data = self.get_sheet_data()
 
             if data:
-                df = pd.DataFrame(data[1:], columns=data[0])
-                missing_aria_links = list(
-                    df[df["Missing Aria"] == "yes"]["Link URL"]
+                store = self.get_results_store(data)
+                self.display_missing_aria(
+                    store, store.find("Missing Aria", "yes")
                 )
-                self.display_missing_aria(missing_aria_links)
             else:
-                print("No data found in Google Sheets.")
+                print(f"No data found in the {self.SINK.name}.")
         except Exception:
             print(self.ERROR_MESSAGE)
 
     def print_links_with_connection_errors(self):
         """
-        Print links with connection errors from Google Sheets.
+        Print the links that were not verified (connection errors,
+        non-web links...) from the saved results, grouped by reason.
         """
         try:
             # Fetch all data from the worksheet
-            data = self.WORKSHEET.get_all_values()
+            data = self.get_sheet_data()
         except Exception as e:
             print(
                 self.RED
-                + "An error occurred while reading data from Google Sheets:",
+                + f"An error occurred while reading the {self.SINK.name}:",
                 str(e) + self.RESET,
             )
             return
 
         if data:
-            # Convert data to a DataFrame for easier manipulation
-            df = pd.DataFrame(data[1:], columns=data[0])
-
-            # Count the number of connection errors
-            if "Response" in df.columns:
-                num_connection_errors = len(
-                    df[
-                        df["Response"].str.contains(
-                            "No connection adapters were found"
-                        )
-                    ]
-                )
+            store = self.get_results_store(data)
 
-                if num_connection_errors > 0:
-                    print(
-                        self.RED
-                        + "Links not verified due to connection errors:"
-                        + self.RESET
-                    )
-                    # Filter and print links with connection errors
-                    connection_errors = df[
-                        df["Response"].str.contains(
-                            "No connection adapters were found"
-                        )
-                    ]
-                    for index, row in connection_errors.iterrows():
-                        print(row["Link URL"])
+            # Results saved before reason codes have no Reason column
+            if store.has_column("Reason"):
+                if store.count("Reason", *self.UNVERIFIED_REASONS):
+                    print(self.RED + "Links not verified:" + self.RESET)
+                    # Print the links grouped by reason
+                    for reason, label in self.UNVERIFIED_REASONS.items():
+                        positions = store.find("Reason", reason)
+                        if not positions:
+                            continue
+                        print(self.YELLOW + f"\n{label}:" + self.RESET)
+                        for position in positions:
+                            print(store.get(position, "Link URL"))
                 else:
-                    print(
-                        self.GREEN + "No links with connection errors found."
-                    )
+                    print(self.GREEN + "All links were verified.")
             else:
                 print(self.ERROR_MESSAGE)
         else:
@@ -644,25 +3869,25 @@ class LinkValidator:
         """
         try:
             # Fetch all data from the worksheet
-            data = self.WORKSHEET.get_all_values()
+            data = self.get_sheet_data()
 
             # Check if there is any data in the worksheet
             if not data:
                 print("No links found.")
                 return
 
-            # Convert data to DataFrame
-            df = pd.DataFrame(data[1:], columns=data[0])
+            store = self.get_results_store(data)
 
-            # Filter DataFrame to get broken links
-            broken_links = df[df["Status"] == "broken"]
+            # Rows of the broken links, from the status index
+            broken_links = store.find("Status", "broken")
 
-            if broken_links.empty:
+            if not broken_links:
                 print(self.GREEN + "No broken links found." + self.RESET)
             else:
                 print(self.RED + "Broken links found:" + self.RESET)
-                for broken_link in broken_links["Link URL"]:
-                    print(broken_link)
+                self.browse_results(
+                    store, broken_links, ["Link URL", "Response", "Reason"]
+                )
 
         except Exception:
             print(self.ERROR_MESSAGE)
@@ -681,21 +3906,23 @@ class LinkValidator:
 
     def empty_links_google_sheet(self):
         """
-        Empty the links Google Sheet after user confirmation.
+        Empty the saved links after user confirmation.
         """
         try:
             # Ask for confirmation
             confirmation = input(
                 self.RED
-                + "Are you sure you want to empty the Google Sheet? (y/n): "
+                + f"Are you sure you want to empty the {self.SINK.name}?"
+                + " (y/n): "
                 + self.RESET
             ).lower()
             if confirmation == "y" or confirmation == "yes":
                 # Clear existing data (including header)
-                self.WORKSHEET.clear()
+                self.SINK.clear()
+                self.clear_results()
                 print(
                     self.GREEN
-                    + "\nGoogle Sheet has been emptied successfully."
+                    + f"\n{self.SINK.name} has been emptied successfully."
                     + self.RESET
                 )
             else:
@@ -803,79 +4030,132 @@ class LinkValidator:
         """
         try:
             # Fetch all data from the worksheet
-            data = self.WORKSHEET.get_all_values()
+            data = self.get_sheet_data()
 
             # Check if there is any data in the worksheet
             if not data:
-                print("No links found in Google Sheets.")
+                print(f"No links found in the {self.SINK.name}.")
                 return
 
-            # Convert data to DataFrame
-            df = pd.DataFrame(data[1:], columns=data[0])
+            # Every count comes from the indexes built with the store,
+            # missing columns count as 0
+            store = self.get_results_store(data)
 
             # Check if 'Status' column exists
-            if "Status" not in df.columns:
+            if not store.has_column("Status"):
                 print(self.ERROR_MESSAGE)
                 return
 
-            # Count the number of links scraped
-            num_links_scraped = len(df)
-
-            # Count the number of aria labels found if the column exists
-            if "Missing Aria" in df.columns:
-                num_links_with_aria = len(df[df["Missing Aria"] == "no"])
-            else:
-                num_links_with_aria = 0
+            # Display the summary
+            self.summarize_findings(
+                len(store),
+                store.count("Missing Aria", "no"),
+                store.count("Type", "internal"),
+                store.count("Type", "external"),
+                store.count("Missing Aria", "yes"),
+                store.count("Status", "broken"),
+                store.count("Reason", *self.UNVERIFIED_REASONS),
+            )
 
-            # Count the number of internal links found if the column exists
-            if "Type" in df.columns:
-                num_internal_links = len(df[df["Type"] == "internal"])
-            else:
-                num_internal_links = 0
+        except Exception as e:
+            print("An unexpected error occurred:", str(e))
 
-            # Count the number of external links found if the column exists
-            if "Type" in df.columns:
-                num_external_links = len(df[df["Type"] == "external"])
-            else:
-                num_external_links = 0
+    def display_scan_metrics(self):
+        """
+        Display where the time of the last scan went: the time of every
+        phase, the requests and latency of every host and the cache hits.
+        Offers to export the metrics as JSON or Prometheus text.
+        """
+        if not self.METRICS.enabled:
+            print(self.RED + "\nScan metrics are disabled." + self.RESET)
+            return
+        metrics = self.METRICS.to_dict()
+        if not metrics["phases"]:
+            print(
+                self.RED
+                + "\nNo scan metrics yet. Please scrape a webpage first."
+                + self.RESET
+            )
+            return
 
-            # Count the number of missing aria labels if the column exists
-            if "Missing Aria" in df.columns:
-                num_missing_aria = len(df[df["Missing Aria"] == "yes"])
-            else:
-                num_missing_aria = 0
-
-            # Count the number of connection errors
-            if "Response" in df.columns:
-                num_connection_errors = len(
-                    df[
-                        df["Response"].str.contains(
-                            "No connection adapters were found"
-                        )
-                    ]
-                )
-            else:
-                num_connection_errors = 0
+        print("\n" + self.CYAN + "Time per Phase:" + self.RESET)
+        print(self.YELLOW + f"{'Phase':<16} {'Calls':>8} {'Total (s)':>10}")
+        print("-" * 36 + self.RESET)
+        for name, phase in metrics["phases"].items():
+            print(f"{name:<16} {phase['calls']:>8} {phase['seconds']:>10.3f}")
+        print(
+            "Phases that run in several threads add up the time of each"
+            " thread."
+        )
 
-            # Count the number of broken links if the column exists
-            if "Status" in df.columns:
-                num_broken_links = len(df[df["Status"] == "broken"])
-            else:
-                num_broken_links = 0
+        print("\n" + self.CYAN + "Requests per Host:" + self.RESET)
+        print(
+            self.YELLOW
+            + f"{'Host':<30} {'Requests':>8} {'KiB':>8} {'Mean (ms)':>10}"
+            + f" {'p95 (ms)':>9}"
+        )
+        print("-" * 69 + self.RESET)
+        hosts = sorted(
+            self.METRICS.hosts.items(),
+            key=lambda item: item[1]["requests"],
+            reverse=True,
+        )
+        for host, stats in hosts:
+            mean = stats["latency_seconds"] / stats["requests"] * 1000
+            p95 = self.METRICS.get_latency_percentile(stats, 95)
+            p95 = f"<={p95 * 1000:.0f}" if p95 is not None else "slow"
+            print(
+                f"{host[:30]:<30} {stats['requests']:>8}"
+                f" {stats['bytes'] / 1024:>8.1f} {mean:>10.1f} {p95:>9}"
+            )
+        crawl_delays = self.HOST_SCHEDULER.get_crawl_delays()
+        if crawl_delays:
+            print(
+                "\n"
+                + self.CYAN
+                + "Hosts slowed down by their robots.txt crawl-delay:"
+                + self.RESET
+            )
+            for host, crawl_delay in sorted(crawl_delays.items()):
+                print(f"{host}: one request every {crawl_delay:g} s")
 
-            # Display the summary
-            self.summarize_findings(
-                num_links_scraped,
-                num_links_with_aria,
-                num_internal_links,
-                num_external_links,
-                num_missing_aria,
-                num_broken_links,
-                num_connection_errors,
+        print("\n" + self.CYAN + "Caches:" + self.RESET)
+        for cache, stats in metrics["caches"].items():
+            hit_rate = stats["hit_rate"]
+            hit_rate = f"{hit_rate:.0%}" if hit_rate is not None else "-"
+            print(
+                f"{cache.capitalize()} cache: {stats['hit']} hits,"
+                f" {stats['revalidated']} revalidated,"
+                f" {stats['miss']} misses (hit rate {hit_rate})"
             )
+        self.export_scan_metrics()
 
-        except Exception as e:
-            print("An unexpected error occurred:", str(e))
+    def export_scan_metrics(self):
+        """
+        Ask the user whether to export the scan metrics and in which format.
+        """
+        files = {
+            "json": "scan_metrics.json",
+            "prometheus": "scan_metrics.prom",
+        }
+        choice = (
+            input(
+                self.YELLOW
+                + "\nExport the metrics? Enter json, prometheus or press"
+                + " Enter to skip: "
+                + self.RESET
+            )
+            .strip()
+            .lower()
+        )
+        if choice not in files:
+            return
+        try:
+            self.METRICS.save(files[choice], choice)
+        except OSError as e:
+            print(self.RED + f"Could not export the metrics: {e}" + self.RESET)
+            return
+        print(self.GREEN + f"Metrics saved to {files[choice]}." + self.RESET)
 
     def ask_continue(self):
         """
@@ -918,6 +4198,9 @@ class LinkValidator:
         The main function of the Link-Validator Tool.
         """
         self.clear_console()
+        if not self.welcome_shown:
+            self.print_welcome_message()
+            self.welcome_shown = True
         try:
             while True:
                 self.print_instructions()
@@ -944,6 +4227,14 @@ class LinkValidator:
                     self.open_google_sheet()
                 elif choice == 9:
                     self.open_github()
+                elif choice == 10:
+                    self.crawl_and_validate_links()
+                elif choice == 11:
+                    self.incremental_scan_links()
+                elif choice == 12:
+                    self.display_scan_metrics()
+                elif choice == 13:
+                    self.batch_validate_links()
                 elif choice == 0:
                     print(self.RED + "\nExiting the program..." + self.RESET)
                     timer.sleep(1)
@@ -957,6 +4248,175 @@ class LinkValidator:
             exit()
 
 
+# LinkValidator of each process parsing pages in a batch scan
+PARSE_WORKER_PARSER = None
+
+
+def init_parse_worker(parser):
+    """
+    Set the parser of a parsing process of a batch scan.
+    """
+    global PARSE_WORKER_PARSER
+    PARSE_WORKER_PARSER = parser
+
+
+def parse_page_anchors(content, base_url):
+    """
+    Extract the anchors of a webpage in a parsing process.
+    """
+    global PARSE_WORKER_PARSER
+    try:
+        return parse_anchors(content, base_url, PARSE_WORKER_PARSER)
+    except FeatureNotFound:
+        # The parser isn't installed, use the built-in one from now on
+        PARSE_WORKER_PARSER = "html.parser"
+        return parse_anchors(content, base_url, PARSE_WORKER_PARSER)
+
+
+def parse_arguments(argv=None):
+    """
+    Parse the command-line arguments for the headless mode.
+    """
+    parser = argparse.ArgumentParser(
+        description="Scrape webpages and validate their links. Without"
+        " any URLs the interactive menu is started."
+    )
+    parser.add_argument("urls", nargs="*", help="URLs of the pages to scan")
+    parser.add_argument(
+        "-f",
+        "--url-file",
+        help="file with one URL per line (blank lines and # are ignored)",
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write the results to (default stdout)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl"],
+        default="csv",
+        help="format of the results (default csv)",
+    )
+    parser.add_argument(
+        "--crawl",
+        action="store_true",
+        help="follow internal links and scan the whole website",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="scan all the URLs together: pages are parsed in a process pool"
+        " and every link is checked once for all the pages",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="number of processes parsing pages in a batch scan",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only re-check links that are new, were broken or have expired"
+        " from the cache, and report the changes since the last scan",
+    )
+    parser.add_argument(
+        "--diff-output",
+        help="file to write the changes of an incremental scan to as JSON",
+    )
+    parser.add_argument(
+        "--metrics-output",
+        help="file to write the scan metrics to (timings, hosts, caches)",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=["json", "prometheus"],
+        default="json",
+        help="format of the scan metrics (default json)",
+    )
+    parser.add_argument(
+        "--no-metrics",
+        action="store_true",
+        help="don't collect scan metrics",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=["sheets", "csv", "jsonl", "sqlite"],
+        help="where to save the results (default sheets for the menu;"
+        " in headless mode results are only saved to a sink if given)",
+    )
+    parser.add_argument(
+        "--sink-path", help="file used by the csv, jsonl and sqlite sinks"
+    )
+    parser.add_argument(
+        "--parser",
+        choices=["html.parser", "lxml", "stream"],
+        help="HTML parser used to find the links (default html.parser)",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        help="maximum crawl depth (--crawl or menu option 10)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        help="maximum number of pages crawled (--crawl or menu option 10)",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.batch and (arguments.crawl or arguments.incremental):
+        parser.error(
+            "--batch cannot be combined with --crawl or --incremental"
+        )
+
+    if arguments.url_file:
+        try:
+            with open(arguments.url_file, encoding="utf-8") as file:
+                for line in file:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        arguments.urls.append(line)
+        except OSError as e:
+            parser.error(f"could not read {arguments.url_file}: {e}")
+    return arguments
+
+
 if __name__ == "__main__":
-    link_validator = LinkValidator()
+    arguments = parse_arguments()
+    # Without URLs the interactive menu is started
+    headless = bool(arguments.urls or arguments.url_file)
+    link_validator = LinkValidator(
+        interactive=not headless,
+        sink=arguments.sink or "sheets",
+        sink_path=arguments.sink_path,
+    )
+    if arguments.parser:
+        link_validator.PARSER = arguments.parser
+    if arguments.depth is not None:
+        link_validator.CRAWL_MAX_DEPTH = arguments.depth
+    if arguments.max_pages is not None:
+        link_validator.CRAWL_MAX_PAGES = arguments.max_pages
+    if arguments.processes is not None:
+        link_validator.BATCH_PROCESSES = arguments.processes
+    if arguments.no_metrics:
+        link_validator.COLLECT_METRICS = False
+        link_validator.METRICS.enabled = False
+
+    if headless:
+        # Headless mode for CI and cron
+        try:
+            exit_code = link_validator.run_headless(
+                arguments.urls,
+                arguments.output,
+                arguments.format,
+                arguments.crawl,
+                save_to_sink=arguments.sink is not None,
+                incremental=arguments.incremental,
+                diff_output=arguments.diff_output,
+                metrics_output=arguments.metrics_output,
+                metrics_format=arguments.metrics_format,
+                batch=arguments.batch,
+            )
+        except KeyboardInterrupt:
+            print("Scan interrupted by user.", file=sys.stderr)
+            exit_code = 130
+        sys.exit(exit_code)
     link_validator.main()